@@ -1582,9 +1582,16 @@ def unhide(self):
 class Links(list):
     """List of menu or button links."""
 
+    _menu_events_bound = False # frame wide menu handlers are bound once
+
     #--Popup a menu from the links
     def new_menu(self, parent, selection):
         parent = parent or Link.Frame
+        if not Links._menu_events_bound:
+            native_frame = Link.Frame._native_widget
+            native_frame.Bind(wx.EVT_MENU_HIGHLIGHT_ALL, ItemLink.ShowHelp)
+            native_frame.Bind(wx.EVT_MENU_OPEN, MenuLink.OnMenuOpen)
+            Links._menu_events_bound = True
         menu = wx.Menu() # TODO(inf) de-wx!
         Link.Popup = menu
         for link in self:
@@ -1754,7 +1761,6 @@ def AppendToMenu(self, menu, window, selection):
         menuItem = wx.MenuItem(menu, wx.ID_ANY, self._text, self.menu_help,
                                self.__class__.kind)
         Link.Frame._native_widget.Bind(wx.EVT_MENU, self.__Execute, id=menuItem.GetId())
-        Link.Frame._native_widget.Bind(wx.EVT_MENU_HIGHLIGHT_ALL, ItemLink.ShowHelp)
         menu.Append(menuItem)
         return menuItem
 
@@ -1798,7 +1804,6 @@ def _enable(self): return not self.oneDatumOnly or len(self.selected) == 1
     def AppendToMenu(self, menu, window, selection):
         """Append self as submenu (along with submenu items) to menu."""
         super(MenuLink, self).AppendToMenu(menu, window, selection)
-        Link.Frame._native_widget.Bind(wx.EVT_MENU_OPEN, MenuLink.OnMenuOpen)
         subMenu = wx.Menu()
         appended_menu = menu.AppendSubMenu(subMenu, self._text)
         if not self._enable():
@@ -2327,9 +2332,10 @@ def OnDrag(self, event):
                 # update settings
                 uid = self.GetLink(button=button).uid
                 overUid = self.GetLink(index=over).uid
-                overIndex = _settings['bash.statusbar.order'].index(overUid)
-                _settings['bash.statusbar.order'].remove(uid)
-                _settings['bash.statusbar.order'].insert(overIndex, uid)
+                order = _settings['bash.statusbar.order']
+                overIndex = order.index(overUid)
+                order.remove(uid)
+                order.insert(overIndex, uid)
                 _settings.setChanged('bash.statusbar.order')
                 # update self.buttons
                 self.buttons.remove(button)
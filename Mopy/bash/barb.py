@@ -106,9 +106,12 @@ def __init__(self, settings_file, fsName, mods_folder):
         self.files = {}
         for (bash_dir, tmpdir), setting_files in \
                 _init_settings_files(fsName, mods_folder).iteritems():
-            if not setting_files: # we have to backup everything in there
-                setting_files = bash_dir.list()
             tmp_dir = GPath(tmpdir)
+            if not setting_files: # we have to backup everything in there
+                # no need to stat what we just listed
+                self.files.update((tmp_dir.join(fname), bash_dir.join(fname))
+                                  for fname in bash_dir.list())
+                continue
             for fname in setting_files:
                 fpath = bash_dir.join(fname)
                 if fpath.exists():
@@ -3574,6 +3574,7 @@ def Execute(self):
             else:
                 Link.Frame.notebook.InsertPage(insertAt,panel._native_widget,title)
         bass.settings['bash.tabs.order'][self.tabKey] ^= True
+        InitTabLinks() # build the menus of a newly shown tab
 
 class BashNotebook(wx.Notebook, balt.TabDragMixin):
 
@@ -3716,6 +3717,7 @@ class BashStatusBar(DnDStatusBar):
     SettingsMenu = Links()
     obseButton = None
     laaButton = None
+    _uid_to_link = None # built on first use, see GetLink
 
     def UpdateIconSizes(self):
         self.buttons = [] # will be populated with _displayed_ gButtons - g ?
@@ -3741,15 +3743,17 @@ def UpdateIconSizes(self):
             except AttributeError: # '_App_Button' object has no attribute 'imageKey'
                 deprint(u'Failed to load button %r' % (uid,), traceback=True)
         # Add any new buttons
+        ordered_uids = set(order)
         for link in BashStatusBar.buttons:
             # Already tested?
             uid = link.uid
-            if uid in order: continue
+            if uid in ordered_uids: continue
             # Remove any hide settings, if they exist
             if uid in hide:
                 hide.discard(uid)
                 hideChanged = True
             order.append(uid)
+            ordered_uids.add(uid)
             orderChanged = True
             try:
                 self._addButton(link)
@@ -3786,13 +3790,15 @@ def UnhideButton(self,link):
             # Specified, but now factor in hidden buttons, etc
             self._addButton(link)
             button = self.buttons.pop()
-            thisIndex, insertBefore = order.index(link.uid), 0
-            for i in range(len(self.buttons)):
-                otherlink = self.GetLink(index=i)
-                indexOther = order.index(otherlink.uid)
-                if indexOther > thisIndex:
-                    insertBefore = i
-                    break
+            order_pos = {u: i for i, u in enumerate(order)}
+            thisIndex = order_pos[uid]
+            # position in the order of each displayed button
+            button_pos = {link.gButton: order_pos.get(link.uid, -1) for link
+                          in BashStatusBar.buttons
+                          if link.gButton is not None}
+            insertBefore = next((i for i, b in enumerate(self.buttons)
+                                 if button_pos[b] > thisIndex),
+                                len(self.buttons))
             self.buttons.insert(insertBefore,button)
         self._do_refresh()
 
@@ -3800,9 +3806,11 @@ def GetLink(self,uid=None,index=None,button=None):
         """Get the Link object with a specific uid,
            or that made a specific button."""
         if uid is not None:
-            for link in BashStatusBar.buttons:
-                if link.uid == uid:
-                    return link
+            # All status bar links are created by InitStatusBar on boot
+            if BashStatusBar._uid_to_link is None:
+                BashStatusBar._uid_to_link = {link.uid: link for link in
+                                              BashStatusBar.buttons}
+            return BashStatusBar._uid_to_link.get(uid)
         elif index is not None:
             button = self.buttons[index]
         if button is not None:
@@ -4216,6 +4224,8 @@ def Init(self): # not OnInit(), we need to initialize _after_ the app has been i
             splash_screen.stop_splash()
         self.SetTopWindow(frame._native_widget)
         frame.show_frame()
+        # Build the tab menus once the event loop runs, after the window shows
+        wx.CallAfter(InitTabLinks)
         frame.is_maximized = settings[u'bash.frameMax']
         frame.RefreshData(booting=True) # used to bind RefreshData
         # Moved notebook.Bind() callback here as OnShowPage() is explicitly
@@ -4384,4 +4394,4 @@ def _png(fname): return Image(imgDirJn(fname))
     Resources.bashMonkey = balt.ImageBundle()
     Resources.bashMonkey.Add(imgDirJn(u'wrye_monkey_87_sharp.ico'))
 
-from .links_init import InitLinks
+from .links_init import InitLinks, InitTabLinks
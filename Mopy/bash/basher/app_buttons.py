@@ -131,7 +131,14 @@ def version(self):
         return u''
 
     def set_sb_button_tooltip(self):
-        if self.gButton: self.gButton.tooltip = self.sb_button_tip
+        # Hidden buttons get a fresh tooltip when they are unhidden
+        if self.gButton and self.gButton.visible:
+            # same tooltip Obse_Button.UpdateToolTips would set
+            if self._obseTip is not None and \
+                    BashStatusBar.obseButton.button_state:
+                self.gButton.tooltip = self.obseTip
+            else:
+                self.gButton.tooltip = self.sb_button_tip
 
     @property
     def sb_button_tip(self):
@@ -21,6 +21,8 @@
 #  https://github.com/wrye-bash
 #
 # =============================================================================
+import re
+
 from . import bEnableWizard, tabInfo, BashFrame
 from .constants import colorInfo, settingDefaults, installercons
 from .. import bass, balt, bosh, bolt, bush, env
@@ -31,6 +33,15 @@
     Stretch, TextArea, TextField, VLayout, DropDown, DialogWindow, \
     ColorPicker, ListBox, Color, Picture, BusyCursor
 
+# A line of an exported color configuration, e.g. 'default.text: (0, 0, 0)'
+_color_line_re = re.compile(
+    u'' r'^([\w.]+):\s*\((\d+),\s*(\d+),\s*(\d+)(?:,\s*(\d+))?\)\s*$', re.U)
+
+# settingDefaults is never modified (settings get deep copies of it), so the
+# default colors can be built once
+_default_colors = {k: Color(*v) for k, v in
+                   settingDefaults['bash.colors'].iteritems()}
+
 class ColorDialog(DialogWindow):
     """Color configuration dialog"""
     title = _(u'Color Configuration')
@@ -43,17 +54,30 @@ class ColorDialog(DialogWindow):
         'tweak': _(u'[INI Edits] '),
         'default': _(u'[All] '),
     }
+    _sorted_display = None # (display text, color key) pairs, see below
+
+    @classmethod
+    def _get_sorted_display(cls):
+        """Return the display texts of the color keys paired with the keys,
+        sorted by display text - the keys never change while Bash runs, so
+        this is only computed the first time the dialog is shown."""
+        if cls._sorted_display is None:
+            # _keys_to_tabs values are already translated
+            def _display_text(k):
+                return cls._keys_to_tabs[k.split(u'.', 1)[0]] + colorInfo[k][0]
+            cls._sorted_display = sorted(
+                [(_display_text(x), x) for x in colors],
+                key=lambda pair: pair[0].lower())
+        return cls._sorted_display
 
     def __init__(self):
         super(ColorDialog, self).__init__(parent=Link.Frame,
                                           icon_bundle=Resources.bashBlue)
         self.changes = dict()
         #--DropDown
-        def _display_text(k):
-            return _(self._keys_to_tabs[k.split('.')[0]]) + colorInfo[k][0]
-        self.text_key = dict((_display_text(x), x) for x in colors)
-        colored = self.text_key.keys()
-        colored.sort(key=unicode.lower)
+        sorted_display = self._get_sorted_display()
+        self.text_key = dict(sorted_display)
+        colored = [display for display, _key in sorted_display]
         combo_text = colored[0]
         choiceKey = self.text_key[combo_text]
         self.comboBox = DropDown(self, value=combo_text, choices=colored)
@@ -102,35 +126,34 @@ def GetColorKey(self):
     @staticmethod
     def UpdateUIColors():
         """Update the Bash Frame with the new colors"""
+        # Freeze the notebook so that it is repainted once, not once per tab
+        notebook = Link.Frame.notebook
         with BusyCursor():
-            for (className,title,panel) in tabInfo.itervalues():
-                if panel is not None:
-                    panel.RefreshUIColors()
+            notebook.Freeze()
+            try:
+                for (className,title,panel) in tabInfo.itervalues():
+                    if panel is not None:
+                        panel.RefreshUIColors()
+            finally:
+                notebook.Thaw()
+
+    def _all_default(self):
+        """Return True if all colors will be the defaults once the pending
+        changes are applied."""
+        return all(self.changes.get(k, colors[k]) == _default_colors[k]
+                   for k in colors)
 
     def UpdateUIButtons(self):
-        # Apply All and Default All
-        for key, val in self.changes.items():
-            if val == colors[key]:
-                del self.changes[key]
+        # Apply All and Default All - note Color only defines __eq__
+        self.changes = {k: v for k, v in self.changes.iteritems()
+                        if not v == colors[k]}
         anyChanged = bool(self.changes)
-        allDefault = True
-        for key in colors:
-            if key in self.changes:
-                color = self.changes[key]
-            else:
-                color = colors[key]
-            default = color == Color(*settingDefaults['bash.colors'][key])
-            if not default:
-                allDefault = False
-                break
+        allDefault = self._all_default()
         # Apply and Default
         color_key = self.GetColorKey()
-        changed = bool(color_key in self.changes)
-        if changed:
-            color = self.changes[color_key]
-        else:
-            color = colors[color_key]
-        default = color == Color(*settingDefaults['bash.colors'][color_key])
+        changed = color_key in self.changes
+        color = self.changes.get(color_key, colors[color_key])
+        default = color == _default_colors[color_key]
         # Update the Buttons, DropDown, and ColorPicker
         self.apply.enabled = changed
         self.applyAll.enabled = anyChanged
@@ -141,14 +164,13 @@ def UpdateUIButtons(self):
 
     def OnDefault(self):
         color_key = self.GetColorKey()
-        newColor = Color(*settingDefaults['bash.colors'][color_key])
-        self.changes[color_key] = newColor
+        self.changes[color_key] = _default_colors[color_key]
         self.UpdateUIButtons()
 
     def OnDefaultAll(self):
         for key in colors:
-            default = Color(*settingDefaults['bash.colors'][key])
-            if colors[key] != default:
+            default = _default_colors[key]
+            if not colors[key] == default:
                 self.changes[key] = default
         self.UpdateUIButtons()
 
@@ -177,26 +199,21 @@ def OnOK(self): # will also close the dialog (send EVT_CLOSE probably)
 
     def OnExport(self):
         outDir = bass.dirs['patches']
-        outDir.makedirs()
         #--File dialog
         outPath = balt.askSave(self, _(u'Export color configuration to:'),
                                outDir, _(u'Colors.txt'), u'*.txt')
         if not outPath: return
         try:
             with outPath.open('w') as file:
-                for key in sorted(colors):
-                    if key in self.changes:
-                        color = self.changes[key]
-                    else:
-                        color = colors[key]
-                    file.write(u'%s: %s\n' % (key, color.to_rgb_tuple()))
+                file.write(u''.join([u'%s: %s\n' % (
+                    key, self.changes.get(key, colors[key]).to_rgb_tuple())
+                    for key in sorted(colors)]))
         except Exception as e:
             balt.showError(self, _(u'An error occurred writing to ') +
                            outPath.stail + u':\n\n%s' % e)
 
     def OnImport(self):
         inDir = bass.dirs['patches']
-        inDir.makedirs()
         #--File dialog
         inPath = balt.askOpen(self, _(u'Import color configuration from:'),
                               inDir, _(u'Colors.txt'), u'*.txt',
@@ -206,29 +223,23 @@ def OnImport(self):
             with inPath.open('r') as file:
                 for line in file:
                     # Format validation
-                    if u':' not in line:
-                        continue
-                    split = line.split(u':')
-                    if len(split) != 2:
+                    ma_color = _color_line_re.match(line)
+                    if not ma_color:
                         continue
-                    key = split[0]
+                    key = ma_color.group(1)
                     # Verify color exists
                     if key not in colors:
                         continue
-                    # Parse the color, verify that it's actually valid
-                    color_tup = tuple([int(c.strip()) for c
-                                       in split[1].strip()[1:-1].split(u',')])
-                    if len(color_tup) not in (3, 4):
+                    # Verify that the color is actually valid
+                    color_tup = tuple([int(c) for c in ma_color.groups()[1:]
+                                       if c is not None])
+                    if not all(value <= 255 for value in color_tup):
                         continue
-                    for value in color_tup:
-                        if value < 0 or value > 255:
-                            break
-                    else:
-                        # All checks passed, save it
-                        color = Color(*color_tup)
-                        if color == colors[key] and key not in self.changes:
-                            continue # skip, identical to our current state
-                        self.changes[key] = color
+                    # All checks passed, save it
+                    color = Color(*color_tup)
+                    if color == colors[key] and key not in self.changes:
+                        continue # skip, identical to our current state
+                    self.changes[key] = color
         except Exception as e:
             balt.showError(Link.Frame, _(
                 u'An error occurred reading from ') + inPath.stail +
@@ -244,8 +255,17 @@ def OnComboBox(self):
     def OnColorPicker(self):
         color_key = self.GetColorKey()
         newColor = self.picker.get_color()
-        self.changes[color_key] = newColor
-        self.UpdateUIButtons()
+        # Only the selected color changed, so skip the full UpdateUIButtons
+        if newColor == colors[color_key]:
+            self.changes.pop(color_key, None)
+        else:
+            self.changes[color_key] = newColor
+        default = newColor == _default_colors[color_key]
+        self.apply.enabled = color_key in self.changes
+        self.applyAll.enabled = bool(self.changes)
+        self.default.enabled = not default
+        self.defaultAll.enabled = not default or not self._all_default()
+        self.comboBox.set_focus_from_kb()
 
     def on_closing(self, destroy=True):
         self.ok.on_clicked.unsubscribe(self.OnOK)
@@ -47,6 +47,95 @@
 from .mod_links import *
 from .bsa_links import *
 
+#------------------------------------------------------------------------------
+# Computed once at import time, the game is set before basher is imported
+_IS_OBLIVION = bush.game.fsName == u'Oblivion'
+_TR_FILE = _(u'File..')
+_TR_FILES = _(u'Files..')
+# SeparatorLink holds no state, so a single instance is shared by all menus
+_separator = SeparatorLink()
+
+_OBLIVION_VERSIONS = (u'1.1', u'1.1b', u'GOTY non-SI', u'SI')
+
+def _oblivion_versions_menu(set_profile):
+    """Return the Oblivion.esm versions submenu."""
+    versionsMenu = MenuLink(u'Oblivion.esm')
+    versionsMenu.links.extend(
+        Mods_OblivionVersion(v, setProfile=set_profile) for v in
+        _OBLIVION_VERSIONS)
+    return versionsMenu
+
+def _build_files_menu(*extra_links):
+    """Return a Files.. submenu holding an Open link followed by
+    extra_links."""
+    files_menu = MenuLink(_TR_FILES)
+    files_menu.links.append(UIList_OpenStore())
+    files_menu.links.extend(extra_links)
+    return files_menu
+
+def _build_jpeg_quality_menu():
+    """Return the JPEG Quality submenu of the Screens tab."""
+    qualityMenu = MenuLink(_(u'JPEG Quality'))
+    qualityMenu.links.extend(Screens_JpgQuality(i) for i in
+                             range(100, 80, -5))
+    qualityMenu.links.append(Screens_JpgQualityCustom())
+    return qualityMenu
+
+# Per game Export/Import submenu entries of the Mods tab, keyed by fsName
+_skyrim_export = (Mod_FullNames_Export, Mod_Prices_Export)
+_skyrim_import = (Mod_FullNames_Import, Mod_Prices_Import)
+_mod_export_links = {
+    u'Enderal': _skyrim_export,
+    u'Skyrim': _skyrim_export,
+    u'FalloutNV': (# Mod_Factions_Export,
+                   Mod_FullNames_Export, Mod_Prices_Export,
+                   Mod_FactionRelations_Export,
+                   # Mod_IngredientDetails_Export, Mod_Scripts_Export,
+                   # Mod_SpellRecords_Export,
+                   Mod_Stats_Export),
+    u'Fallout3': (Mod_FullNames_Export, Mod_Prices_Export, Mod_Stats_Export,
+                  Mod_FactionRelations_Export),
+    u'Oblivion': (Mod_Factions_Export, Mod_FullNames_Export,
+                  Mod_ActorLevels_Export, CBash_Mod_MapMarkers_Export,
+                  Mod_Prices_Export, Mod_FactionRelations_Export,
+                  Mod_IngredientDetails_Export, Mod_Scripts_Export,
+                  Mod_SigilStoneDetails_Export, Mod_SpellRecords_Export,
+                  Mod_Stats_Export),
+}
+_mod_import_links = {
+    u'Enderal': _skyrim_import,
+    u'Skyrim': _skyrim_import,
+    u'FalloutNV': (Mod_FullNames_Import, Mod_Prices_Import,
+                   Mod_FactionRelations_Import,
+                   # Mod_IngredientDetails_Import, Mod_Scripts_Import,
+                   Mod_Stats_Import,
+                   # SeparatorLink, Mod_Face_Import, Mod_Fids_Replace,
+                   ),
+    u'Fallout3': (Mod_FullNames_Import, Mod_Prices_Import, Mod_Stats_Import,
+                  Mod_FactionRelations_Import),
+    u'Oblivion': (Mod_Factions_Import, Mod_FullNames_Import,
+                  Mod_ActorLevels_Import, CBash_Mod_MapMarkers_Import,
+                  Mod_Prices_Import, Mod_FactionRelations_Import,
+                  Mod_IngredientDetails_Import, Mod_Scripts_Import,
+                  Mod_SigilStoneDetails_Import, Mod_SpellRecords_Import,
+                  Mod_Stats_Import, SeparatorLink, Mod_Face_Import,
+                  Mod_Fids_Replace),
+}
+# Formats offered by the Convert submenu of the Screens tab
+_convert_types = tuple((ext, Image.typesDict[ext]) for ext in
+                       (u'jpg', u'png', u'bmp', u'tif'))
+
+# Trailing entries of the Mods tab item menu, filtered once for the game
+_mod_advanced_links = tuple(l for l, game_has_link in (
+    (Mod_CopyToEsmp, True),
+    (Mod_DecompileAll, _IS_OBLIVION),
+    (Mod_FlipEsm, True),
+    (Mod_FlipEsl, bush.game.check_esl),
+    (Mod_FlipMasters, True),
+    (Mod_CreateDummyMasters, True),
+    (Mod_SetVersion, _IS_OBLIVION),
+) if game_has_link)
+
 #------------------------------------------------------------------------------
 def InitStatusBar():
     """Initialize status bar links."""
@@ -67,6 +156,10 @@ def _init_tool_buttons(): # tooldirs must have been initialized
                 imageList(u'tools/tesvgecko%s.png'),
                 _(u"Launch TesVGecko"), {'uid': u'TesVGecko'}),
         )
+    game, ck = bush.game, bush.game.Ck
+    app_dir = bass.dirs['app']
+    show_modeling = bass.inisettings['ShowModelingToolLaunchers']
+    show_texture = bass.inisettings['ShowTextureToolLaunchers']
     #--Bash Status/LinkBar
     BashStatusBar.obseButton = obseButton = Obse_Button(uid=u'OBSE')
     BashStatusBar.buttons.append(obseButton)
@@ -75,20 +168,20 @@ def _init_tool_buttons(): # tooldirs must have been initialized
     BashStatusBar.buttons.append(AutoQuit_Button(uid=u'AutoQuit'))
     BashStatusBar.buttons.append( # Game
         Game_Button(
-            bass.dirs['app'].join(bush.game.launch_exe),
-            bass.dirs['app'].join(*bush.game.version_detect_file),
-            imageList(u'%s%%s.png' % bush.game.fsName.lower()),
-            u' '.join((_(u"Launch"),bush.game.displayName)),
-            u' '.join((_(u"Launch"),bush.game.displayName,u'%(version)s'))))
+            app_dir.join(game.launch_exe),
+            app_dir.join(*game.version_detect_file),
+            imageList(u'%s%%s.png' % game.fsName.lower()),
+            u' '.join((_(u"Launch"),game.displayName)),
+            u' '.join((_(u"Launch"),game.displayName,u'%(version)s'))))
     BashStatusBar.buttons.append( #TESCS/CreationKit
         TESCS_Button(
-            bass.dirs['app'].join(bush.game.Ck.exe),
-            imageList(bush.game.Ck.image_name),
-            u' '.join((_(u"Launch"),bush.game.Ck.ck_abbrev)),
-            u' '.join((_(u"Launch"),bush.game.Ck.ck_abbrev,u'%(version)s')),
-            bush.game.Ck.se_args))
+            app_dir.join(ck.exe),
+            imageList(ck.image_name),
+            u' '.join((_(u"Launch"),ck.ck_abbrev)),
+            u' '.join((_(u"Launch"),ck.ck_abbrev,u'%(version)s')),
+            ck.se_args))
     BashStatusBar.buttons.append( #OBMM
-        app_button_factory(bass.dirs['app'].join(u'OblivionModManager.exe'),
+        app_button_factory(app_dir.join(u'OblivionModManager.exe'),
                            imageList(u'obmm%s.png'), _(u"Launch OBMM"),
                            uid=u'OBMM'))
     from .constants import toolbar_buttons
@@ -156,7 +249,7 @@ def _init_tool_buttons(): # tooldirs must have been initialized
                 imageList(u'boss%s.png'),
                 _(u"Launch BOSS"),
                 uid=u'BOSS'))
-    if bass.inisettings['ShowModelingToolLaunchers']:
+    if show_modeling:
         from .constants import modeling_tools_buttons
         for mb in modeling_tools_buttons:
             BashStatusBar.buttons.append(Tooldir_Button(*mb))
@@ -165,12 +258,11 @@ def _init_tool_buttons(): # tooldirs must have been initialized
                                imageList(u'tools/softimagemodtool%s.png'),
                                _(u"Launch Softimage Mod Tool"),
                                uid=u'SoftimageModTool'))
-    if bass.inisettings['ShowModelingToolLaunchers'] \
-            or bass.inisettings['ShowTextureToolLaunchers']:
+    if show_modeling or show_texture:
         BashStatusBar.buttons.append( #Nifskope
             Tooldir_Button('NifskopePath', imageList(u'tools/nifskope%s.png'),
                 _(u"Launch Nifskope")))
-    if bass.inisettings['ShowTextureToolLaunchers']:
+    if show_texture:
         from .constants import texture_tool_buttons
         for tt in texture_tool_buttons:
             BashStatusBar.buttons.append(Tooldir_Button(*tt))
@@ -204,11 +296,9 @@ def InitMasterLinks():
     #--MasterList: Column Links
     MasterList.mainMenu.append(SortByMenu(
         sort_options=[Mods_EsmsFirst(), Mods_SelectedFirst()]))
-    MasterList.mainMenu.append(Master_AllowEdit())
-    MasterList.mainMenu.append(Master_ClearRenames())
+    MasterList.mainMenu.extend((Master_AllowEdit(), Master_ClearRenames()))
     #--MasterList: Item Links
-    MasterList.itemMenu.append(Master_ChangeTo())
-    MasterList.itemMenu.append(Master_Disable())
+    MasterList.itemMenu.extend((Master_ChangeTo(), Master_Disable()))
 
 #------------------------------------------------------------------------------
 def InitInstallerLinks():
@@ -218,562 +308,360 @@ def InitInstallerLinks():
     InstallersList.mainMenu.append(SortByMenu(
         sort_options=[Installers_SortActive(), # Installers_SortStructure(),
                       Installers_SortProjects()]))
-    InstallersList.mainMenu.append(ColumnsMenu())
-    InstallersList.mainMenu.append(SeparatorLink())
+    InstallersList.mainMenu.extend((ColumnsMenu(), _separator))
     # Files Menu
-    if True:
-        files_menu = MenuLink(_(u'Files..'))
-        files_menu.links.append(UIList_OpenStore())
-        files_menu.links.append(Files_Unhide(u'installer'))
-        files_menu.links.append(SeparatorLink())
-        files_menu.links.append(Installers_CreateNewProject())
-        InstallersList.mainMenu.append(files_menu)
-    InstallersList.mainMenu.append(SeparatorLink())
+    InstallersList.mainMenu.append(_build_files_menu(
+        Files_Unhide(u'installer'), _separator,
+        Installers_CreateNewProject()))
+    InstallersList.mainMenu.append(_separator)
     #--Actions
-    InstallersList.mainMenu.append(Installers_Refresh())
-    InstallersList.mainMenu.append(Installers_Refresh(full_refresh=True))
-    InstallersList.mainMenu.append(Installers_AddMarker())
-    InstallersList.mainMenu.append(Installers_MonitorInstall())
-    InstallersList.mainMenu.append(SeparatorLink())
-    InstallersList.mainMenu.append(Installers_ListPackages())
-    InstallersList.mainMenu.append(SeparatorLink())
-    InstallersList.mainMenu.append(Installers_AnnealAll())
-    InstallersList.mainMenu.append(SeparatorLink())
-    InstallersList.mainMenu.append(Installers_UninstallAllPackages())
-    InstallersList.mainMenu.append(Installers_UninstallAllUnknownFiles())
-    InstallersList.mainMenu.append(Installers_AutoApplyEmbeddedBCFs())
+    InstallersList.mainMenu.extend((Installers_Refresh(),
+        Installers_Refresh(full_refresh=True), Installers_AddMarker(),
+        Installers_MonitorInstall(), _separator, Installers_ListPackages(),
+        _separator, Installers_AnnealAll(), _separator,
+        Installers_UninstallAllPackages(),
+        Installers_UninstallAllUnknownFiles(),
+        Installers_AutoApplyEmbeddedBCFs()))
     #--Behavior
-    InstallersList.mainMenu.append(SeparatorLink())
-    InstallersList.mainMenu.append(Installers_AvoidOnStart())
-    InstallersList.mainMenu.append(Installers_Enabled())
-    InstallersList.mainMenu.append(SeparatorLink())
-    InstallersList.mainMenu.append(Installers_AutoAnneal())
+    InstallersList.mainMenu.extend((_separator, Installers_AvoidOnStart(),
+        Installers_Enabled(), _separator, Installers_AutoAnneal()))
     if bEnableWizard:
         InstallersList.mainMenu.append(Installers_AutoWizard())
-    InstallersList.mainMenu.append(Installers_AutoRefreshProjects())
-    InstallersList.mainMenu.append(Installers_AutoRefreshBethsoft())
-    InstallersList.mainMenu.append(Installers_BsaRedirection())
-    InstallersList.mainMenu.append(Installers_RemoveEmptyDirs())
-    InstallersList.mainMenu.append(Installers_ConflictsReportShowsInactive())
-    InstallersList.mainMenu.append(Installers_ConflictsReportShowsLower())
+    InstallersList.mainMenu.extend((Installers_AutoRefreshProjects(),
+        Installers_AutoRefreshBethsoft(), Installers_BsaRedirection(),
+        Installers_RemoveEmptyDirs(),
+        Installers_ConflictsReportShowsInactive(),
+        Installers_ConflictsReportShowsLower()))
     InstallersList.mainMenu.append(
         Installers_ConflictsReportShowBSAConflicts())
-    InstallersList.mainMenu.append(Installers_WizardOverlay())
-    InstallersList.mainMenu.append(SeparatorLink())
-    InstallersList.mainMenu.append(Installers_GlobalSkips())
-    InstallersList.mainMenu.append(Installers_GlobalRedirects())
+    InstallersList.mainMenu.extend((Installers_WizardOverlay(), _separator,
+        Installers_GlobalSkips(), Installers_GlobalRedirects()))
     #--Item links
-    if True: #--File Menu
-        file_menu = MenuLink(_(u'File..'))
-        file_menu.links.append(Installer_Open())
-        file_menu.links.append(Installer_Rename())
-        file_menu.links.append(Installer_Duplicate())
-        file_menu.links.append(Installer_Hide())
-        file_menu.links.append(balt.UIList_Delete())
-        InstallersList.itemMenu.append(file_menu)
-    if True: #--Open At...
-        openAtMenu = InstallerOpenAt_MainMenu(oneDatumOnly=True)
-        openAtMenu.links.append(Installer_OpenSearch())
-        openAtMenu.links.append(Installer_OpenNexus())
-        openAtMenu.links.append(Installer_OpenTESA())
-        InstallersList.itemMenu.append(openAtMenu)
+    #--File Menu
+    file_menu = MenuLink(_TR_FILE)
+    file_menu.links.extend((Installer_Open(), Installer_Rename(),
+        Installer_Duplicate(), Installer_Hide(), balt.UIList_Delete()))
+    InstallersList.itemMenu.append(file_menu)
+    #--Open At...
+    openAtMenu = InstallerOpenAt_MainMenu(oneDatumOnly=True)
+    openAtMenu.links.extend((Installer_OpenSearch(), Installer_OpenNexus(),
+        Installer_OpenTESA()))
+    InstallersList.itemMenu.append(openAtMenu)
     #--Install, uninstall, etc.
-    InstallersList.itemMenu.append(Installer_OpenReadme())
-    InstallersList.itemMenu.append(Installer_Anneal())
+    InstallersList.itemMenu.extend((Installer_OpenReadme(),
+        Installer_Anneal()))
     InstallersList.itemMenu.append(
         Installer_Refresh(calculate_projects_crc=False))
-    InstallersList.itemMenu.append(Installer_Move())
-    InstallersList.itemMenu.append(SeparatorLink())
-    InstallersList.itemMenu.append(Installer_InstallSmart())
-    if True: # Advanced Installation Menu
-        installMenu = MenuLink(_(u'Advanced Installation..'))
-        installMenu.links.append(Installer_Install())
-        installMenu.links.append(Installer_Install('MISSING'))
-        installMenu.links.append(Installer_Install('LAST'))
-        installMenu.links.append(Installer_Fomod())
-        if bEnableWizard:
-            wizardMenu = MenuLink(_(u'Wizard Installer..'))
-            wizardMenu.links.append(Installer_Wizard(False))
-            wizardMenu.links.append(Installer_Wizard(True))
-            wizardMenu.links.append(Installer_EditWizard())
-            installMenu.links.append(wizardMenu)
-        InstallersList.itemMenu.append(installMenu)
-    InstallersList.itemMenu.append(Installer_Uninstall())
-    InstallersList.itemMenu.append(SeparatorLink())
-    if True:  # Package Menu
-        packageMenu = MenuLink(_(u'Package..'))
-        packageMenu.links.append(Installer_Refresh())
-        packageMenu.links.append(SeparatorLink())
-        if bush.game.has_achlist:
-            packageMenu.links.append(Installer_ExportAchlist())
-        packageMenu.links.append(InstallerProject_Pack())
-        packageMenu.links.append(InstallerProject_ReleasePack())
-        packageMenu.links.append(SeparatorLink())
-        packageMenu.links.append(Installer_ListStructure())
-        packageMenu.links.append(InstallerProject_Sync())
-        packageMenu.links.append(InstallerArchive_Unpack())
-        packageMenu.links.append(Installer_CopyConflicts())
-        InstallersList.itemMenu.append(packageMenu)
+    InstallersList.itemMenu.extend((Installer_Move(), _separator,
+        Installer_InstallSmart()))
+    # Advanced Installation Menu
+    installMenu = MenuLink(_(u'Advanced Installation..'))
+    installMenu.links.extend((Installer_Install(),
+        Installer_Install('MISSING'), Installer_Install('LAST'),
+        Installer_Fomod()))
+    if bEnableWizard:
+        wizardMenu = MenuLink(_(u'Wizard Installer..'))
+        wizardMenu.links.extend((Installer_Wizard(False),
+            Installer_Wizard(True), Installer_EditWizard()))
+        installMenu.links.append(wizardMenu)
+    InstallersList.itemMenu.append(installMenu)
+    InstallersList.itemMenu.extend((Installer_Uninstall(), _separator))
+    # Package Menu
+    packageMenu = MenuLink(_(u'Package..'))
+    packageMenu.links.extend((Installer_Refresh(), _separator))
+    if bush.game.has_achlist:
+        packageMenu.links.append(Installer_ExportAchlist())
+    packageMenu.links.extend((InstallerProject_Pack(),
+        InstallerProject_ReleasePack(), _separator,
+        Installer_ListStructure(), InstallerProject_Sync(),
+        InstallerArchive_Unpack(), Installer_CopyConflicts()))
+    InstallersList.itemMenu.append(packageMenu)
     #--Build
-    if True: #--BAIN Conversion
-        conversionsMenu = InstallerConverter_MainMenu()
-        conversionsMenu.links.append(InstallerConverter_Create())
-        conversionsMenu.links.append(InstallerConverter_ConvertMenu())
-        InstallersList.itemMenu.append(conversionsMenu)
-    InstallersList.itemMenu.append(SeparatorLink())
-    InstallersList.itemMenu.append(Installer_HasExtraData())
-    InstallersList.itemMenu.append(Installer_OverrideSkips())
-    InstallersList.itemMenu.append(Installer_SkipVoices())
-    InstallersList.itemMenu.append(Installer_SkipRefresh())
-    InstallersList.itemMenu.append(SeparatorLink())
-    InstallersList.itemMenu.append(InstallerProject_OmodConfig())
+    #--BAIN Conversion
+    conversionsMenu = InstallerConverter_MainMenu()
+    conversionsMenu.links.extend((InstallerConverter_Create(),
+        InstallerConverter_ConvertMenu()))
+    InstallersList.itemMenu.append(conversionsMenu)
+    InstallersList.itemMenu.extend((_separator, Installer_HasExtraData(),
+        Installer_OverrideSkips(), Installer_SkipVoices(),
+        Installer_SkipRefresh(), _separator, InstallerProject_OmodConfig()))
     # Plugin Filter Main Menu
-    InstallersPanel.espmMenu.append(Installer_Espm_SelectAll())
-    InstallersPanel.espmMenu.append(Installer_Espm_DeselectAll())
-    InstallersPanel.espmMenu.append(Installer_Espm_List())
-    InstallersPanel.espmMenu.append(SeparatorLink())
+    InstallersPanel.espmMenu.extend((Installer_Espm_SelectAll(),
+        Installer_Espm_DeselectAll(), Installer_Espm_List(), _separator))
     # Plugin Filter Item Menu
-    InstallersPanel.espmMenu.append(Installer_Espm_Rename())
-    InstallersPanel.espmMenu.append(Installer_Espm_Reset())
-    InstallersPanel.espmMenu.append(Installer_Espm_ResetAll())
-    InstallersPanel.espmMenu.append(SeparatorLink())
-    InstallersPanel.espmMenu.append(Installer_Espm_JumpToMod())
+    InstallersPanel.espmMenu.extend((Installer_Espm_Rename(),
+        Installer_Espm_Reset(), Installer_Espm_ResetAll(), _separator,
+        Installer_Espm_JumpToMod()))
     #--Sub-Package Main Menu
-    InstallersPanel.subsMenu.append(Installer_Subs_SelectAll())
-    InstallersPanel.subsMenu.append(Installer_Subs_DeselectAll())
-    InstallersPanel.subsMenu.append(Installer_Subs_ToggleSelection())
-    InstallersPanel.subsMenu.append(SeparatorLink())
-    InstallersPanel.subsMenu.append(Installer_Subs_ListSubPackages())
+    InstallersPanel.subsMenu.extend((Installer_Subs_SelectAll(),
+        Installer_Subs_DeselectAll(), Installer_Subs_ToggleSelection(),
+        _separator, Installer_Subs_ListSubPackages()))
 
 #------------------------------------------------------------------------------
 def InitINILinks():
     """Initialize INI Edits tab menus."""
     #--Column Links
     # Sorting and Columns
-    INIList.mainMenu.append(SortByMenu(sort_options=[INI_SortValid()]))
-    INIList.mainMenu.append(ColumnsMenu())
-    INIList.mainMenu.append(SeparatorLink())
+    INIList.mainMenu.extend((SortByMenu(sort_options=[INI_SortValid()]),
+        ColumnsMenu(), _separator))
     # Files Menu
-    if True:
-        files_menu = MenuLink(_(u'Files..'))
-        files_menu.links.append(UIList_OpenStore())
-        INIList.mainMenu.append(files_menu)
-    INIList.mainMenu.append(SeparatorLink())
-    INIList.mainMenu.append(INI_AllowNewLines())
-    INIList.mainMenu.append(INI_ListINIs())
+    INIList.mainMenu.extend((_build_files_menu(), _separator,
+        INI_AllowNewLines(), INI_ListINIs()))
     #--Item menu
-    INIList.itemMenu.append(INI_Apply())
-    INIList.itemMenu.append(INI_CreateNew())
-    INIList.itemMenu.append(INI_ListErrors())
-    INIList.itemMenu.append(SeparatorLink())
-    INIList.itemMenu.append(INI_FileOpenOrCopy())
-    INIList.itemMenu.append(INI_Delete())
+    INIList.itemMenu.extend((INI_Apply(), INI_CreateNew(), INI_ListErrors(),
+        _separator, INI_FileOpenOrCopy(), INI_Delete()))
 
 #------------------------------------------------------------------------------
 def InitModLinks():
     """Initialize Mods tab menus."""
+    game_fsName = bush.game.fsName
+    can_bash = bush.game.Esp.canBash
     #--ModList: Column Links
     # Sorting and Columns
     ModList.mainMenu.append(SortByMenu(
         sort_options=[Mods_EsmsFirst(), Mods_SelectedFirst()]))
-    ModList.mainMenu.append(ColumnsMenu())
-    ModList.mainMenu.append(SeparatorLink())
+    ModList.mainMenu.extend((ColumnsMenu(), _separator))
     # Files Menu
-    if True:
-        files_menu = MenuLink(_(u'Files..'))
-        files_menu.links.append(UIList_OpenStore())
-        files_menu.links.append(Files_Unhide(u'mod'))
-        if bush.game.Esp.canBash:
-            files_menu.links.append(SeparatorLink())
-            files_menu.links.append(Mods_CreateBlankBashedPatch())
-            files_menu.links.append(Mods_CreateBlank())
-            files_menu.links.append(Mods_CreateBlank(masterless=True))
-        ModList.mainMenu.append(files_menu)
-    ModList.mainMenu.append(SeparatorLink())
-    if True: #--Load
-        loadMenu = MenuLink(_(u'Active Mods'))
-        loadMenu.links.append(Mods_LoadList())
-        ModList.mainMenu.append(loadMenu)
-    ModList.mainMenu.append(SeparatorLink())
-    if bush.game.fsName == u'Oblivion': #--Versions
-        versionsMenu = MenuLink(u"Oblivion.esm")
-        versionsMenu.links.append(Mods_OblivionVersion(u'1.1'))
-        versionsMenu.links.append(Mods_OblivionVersion(u'1.1b'))
-        versionsMenu.links.append(Mods_OblivionVersion(u'GOTY non-SI'))
-        versionsMenu.links.append(Mods_OblivionVersion(u'SI'))
-        ModList.mainMenu.append(versionsMenu)
-        ModList.mainMenu.append(SeparatorLink())
-    ModList.mainMenu.append(Mods_ListMods())
-    ModList.mainMenu.append(Mods_ListBashTags())
-    ModList.mainMenu.append(Mods_CleanDummyMasters())
-    ModList.mainMenu.append(SeparatorLink())
-    ModList.mainMenu.append(Mods_AutoGhost())
+    files_menu = _build_files_menu(Files_Unhide(u'mod'))
+    if can_bash:
+        files_menu.links.extend((_separator,
+            Mods_CreateBlankBashedPatch(), Mods_CreateBlank(),
+            Mods_CreateBlank(masterless=True)))
+    ModList.mainMenu.append(files_menu)
+    ModList.mainMenu.append(_separator)
+    #--Load
+    loadMenu = MenuLink(_(u'Active Mods'))
+    loadMenu.links.append(Mods_LoadList())
+    ModList.mainMenu.append(loadMenu)
+    ModList.mainMenu.append(_separator)
+    if _IS_OBLIVION: #--Versions
+        ModList.mainMenu.extend((_oblivion_versions_menu(set_profile=False),
+            _separator))
+    ModList.mainMenu.extend((Mods_ListMods(), Mods_ListBashTags(),
+        Mods_CleanDummyMasters(), _separator, Mods_AutoGhost()))
     if bush.game.has_esl:
         ModList.mainMenu.append(Mods_AutoESLFlagBP())
-    ModList.mainMenu.append(Mods_LockLoadOrder())
-    ModList.mainMenu.append(Mods_LockActivePlugins())
-    ModList.mainMenu.append(Mods_ScanDirty())
-    ModList.mainMenu.append(SeparatorLink())
-    ModList.mainMenu.append(Mods_CrcRefresh())
+    ModList.mainMenu.extend((Mods_LockLoadOrder(), Mods_LockActivePlugins(),
+        Mods_ScanDirty(), _separator, Mods_CrcRefresh()))
     #--ModList: Item Links
-    if bass.inisettings['ShowDevTools'] and bush.game.Esp.canBash:
+    if bass.inisettings['ShowDevTools'] and can_bash:
         ModList.itemMenu.append(Mod_FullLoad())
-    if True: #--File
-        file_menu = MenuLink(_(u'File..'))
-        file_menu.links.append(File_Duplicate())
-        file_menu.links.append(UIList_Hide())
-        file_menu.links.append(Mod_Redate())
-        file_menu.links.append(balt.UIList_Delete())
-        file_menu.links.append(SeparatorLink())
-        file_menu.links.append(File_Backup())
-        file_menu.links.append(File_RevertToBackup())
-        file_menu.links.append(SeparatorLink())
-        file_menu.links.append(File_Snapshot())
-        file_menu.links.append(File_RevertToSnapshot())
-        ModList.itemMenu.append(file_menu)
-    if True: #--Groups
-        groupMenu = MenuLink(_(u"Groups"))
-        groupMenu.links.append(Mod_Groups())
-        ModList.itemMenu.append(groupMenu)
-    if True: #--Ratings
-        ratingMenu = MenuLink(_(u"Rating"))
-        ratingMenu.links.append(Mod_Ratings())
-        ModList.itemMenu.append(ratingMenu)
+    #--File
+    file_menu = MenuLink(_TR_FILE)
+    file_menu.links.extend((File_Duplicate(), UIList_Hide(), Mod_Redate(),
+        balt.UIList_Delete(), _separator, File_Backup(),
+        File_RevertToBackup(), _separator, File_Snapshot(),
+        File_RevertToSnapshot()))
+    ModList.itemMenu.append(file_menu)
+    #--Groups
+    groupMenu = MenuLink(_(u"Groups"))
+    groupMenu.links.append(Mod_Groups())
+    ModList.itemMenu.append(groupMenu)
+    #--Ratings
+    ratingMenu = MenuLink(_(u"Rating"))
+    ratingMenu.links.append(Mod_Ratings())
+    ModList.itemMenu.append(ratingMenu)
     #--------------------------------------------
-    ModList.itemMenu.append(SeparatorLink())
-    ModList.itemMenu.append(Mod_Move())
-    ModList.itemMenu.append(Mod_OrderByName())
-    ModList.itemMenu.append(SeparatorLink())
-    if bush.game.Esp.canBash:
+    ModList.itemMenu.extend((_separator, Mod_Move(), Mod_OrderByName(),
+        _separator))
+    if can_bash:
         ModList.itemMenu.append(Mod_Details())
-    ModList.itemMenu.append(File_ListMasters())
-    ModList.itemMenu.append(Mod_ShowReadme())
-    ModList.itemMenu.append(Mod_ListBashTags())
-    ModList.itemMenu.append(Mod_CreateLOOTReport())
-    ModList.itemMenu.append(Mod_CopyModInfo())
-    ModList.itemMenu.append(Mod_ListDependent())
-    ModList.itemMenu.append(Mod_JumpToInstaller())
+    ModList.itemMenu.extend((File_ListMasters(), Mod_ShowReadme(),
+        Mod_ListBashTags(), Mod_CreateLOOTReport(), Mod_CopyModInfo(),
+        Mod_ListDependent(), Mod_JumpToInstaller()))
     #--------------------------------------------
-    ModList.itemMenu.append(SeparatorLink())
-    ModList.itemMenu.append(Mod_AllowGhosting())
-    ModList.itemMenu.append(Mod_Ghost())
-    if bush.game.Esp.canBash:
-        ModList.itemMenu.append(SeparatorLink())
-        ModList.itemMenu.append(Mod_MarkMergeable())
+    ModList.itemMenu.extend((_separator, Mod_AllowGhosting(), Mod_Ghost()))
+    if can_bash:
+        ModList.itemMenu.extend((_separator, Mod_MarkMergeable()))
         if CBashApi.Enabled:
             ModList.itemMenu.append(Mod_MarkMergeable(doCBash=True))
         ModList.itemMenu.append(Mod_Patch_Update())
         if CBashApi.Enabled:
             ModList.itemMenu.append(Mod_Patch_Update(doCBash=True))
-        ModList.itemMenu.append(Mod_ListPatchConfig())
-        ModList.itemMenu.append(Mod_ExportPatchConfig())
+        ModList.itemMenu.extend((Mod_ListPatchConfig(),
+            Mod_ExportPatchConfig()))
         #--Advanced
-        ModList.itemMenu.append(SeparatorLink())
-        if True: #--Export
-            exportMenu = MenuLink(_(u"Export"))
-            if CBashApi.Enabled:
-                exportMenu.links.append(CBash_Mod_CellBlockInfo_Export())
-            exportMenu.links.append(Mod_EditorIds_Export())
-            if bush.game.fsName in (u'Enderal', u'Skyrim'):
-                exportMenu.links.append(Mod_FullNames_Export())
-                exportMenu.links.append(Mod_Prices_Export())
-            elif bush.game.fsName == u'FalloutNV':
-                # exportMenu.links.append(Mod_Factions_Export())
-                exportMenu.links.append(Mod_FullNames_Export())
-                exportMenu.links.append(Mod_Prices_Export())
-                exportMenu.links.append(Mod_FactionRelations_Export())
-                # exportMenu.links.append(Mod_IngredientDetails_Export())
-                # exportMenu.links.append(Mod_Scripts_Export())
-                # exportMenu.links.append(Mod_SpellRecords_Export())
-                exportMenu.links.append(Mod_Stats_Export())
-            elif bush.game.fsName == u'Fallout3':
-                exportMenu.links.append(Mod_FullNames_Export())
-                exportMenu.links.append(Mod_Prices_Export())
-                exportMenu.links.append(Mod_Stats_Export())
-                exportMenu.links.append(Mod_FactionRelations_Export())
-            elif bush.game.fsName == u'Oblivion':
-                exportMenu.links.append(Mod_Factions_Export())
-                exportMenu.links.append(Mod_FullNames_Export())
-                exportMenu.links.append(Mod_ActorLevels_Export())
-                exportMenu.links.append(CBash_Mod_MapMarkers_Export())
-                exportMenu.links.append(Mod_Prices_Export())
-                exportMenu.links.append(Mod_FactionRelations_Export())
-                exportMenu.links.append(Mod_IngredientDetails_Export())
-                exportMenu.links.append(Mod_Scripts_Export())
-                exportMenu.links.append(Mod_SigilStoneDetails_Export())
-                exportMenu.links.append(Mod_SpellRecords_Export())
-                exportMenu.links.append(Mod_Stats_Export())
-            ModList.itemMenu.append(exportMenu)
-        if True: #--Import
-            importMenu = MenuLink(_(u"Import"))
-            importMenu.links.append(Mod_EditorIds_Import())
-            if bush.game.fsName in (u'Enderal', u'Skyrim'):
-                importMenu.links.append(Mod_FullNames_Import())
-                importMenu.links.append(Mod_Prices_Import())
-            elif bush.game.fsName == u'FalloutNV':
-                importMenu.links.append(Mod_FullNames_Import())
-                importMenu.links.append(Mod_Prices_Import())
-                importMenu.links.append(Mod_FactionRelations_Import())
-                # importMenu.links.append(Mod_IngredientDetails_Import())
-                # importMenu.links.append(Mod_Scripts_Import())
-                importMenu.links.append(Mod_Stats_Import())
-                # importMenu.links.append(SeparatorLink())
-                # importMenu.links.append(Mod_Face_Import())
-                # importMenu.links.append(Mod_Fids_Replace())
-            elif bush.game.fsName == u'Fallout3':
-                importMenu.links.append(Mod_FullNames_Import())
-                importMenu.links.append(Mod_Prices_Import())
-                importMenu.links.append(Mod_Stats_Import())
-                importMenu.links.append(Mod_FactionRelations_Import())
-            elif bush.game.fsName == u'Oblivion':
-                importMenu.links.append(Mod_Factions_Import())
-                importMenu.links.append(Mod_FullNames_Import())
-                importMenu.links.append(Mod_ActorLevels_Import())
-                importMenu.links.append(CBash_Mod_MapMarkers_Import())
-                importMenu.links.append(Mod_Prices_Import())
-                importMenu.links.append(Mod_FactionRelations_Import())
-                importMenu.links.append(Mod_IngredientDetails_Import())
-                importMenu.links.append(Mod_Scripts_Import())
-                importMenu.links.append(Mod_SigilStoneDetails_Import())
-                importMenu.links.append(Mod_SpellRecords_Import())
-                importMenu.links.append(Mod_Stats_Import())
-                importMenu.links.append(SeparatorLink())
-                importMenu.links.append(Mod_Face_Import())
-                importMenu.links.append(Mod_Fids_Replace())
-            ModList.itemMenu.append(importMenu)
-        if True: #--Cleaning
-            cleanMenu = MenuLink(_(u"Mod Cleaning"))
-            cleanMenu.links.append(Mod_SkipDirtyCheck())
-            cleanMenu.links.append(SeparatorLink())
-            cleanMenu.links.append(Mod_ScanDirty())
-            cleanMenu.links.append(Mod_RemoveWorldOrphans())
-            if bush.game.fsName == u'Oblivion':
-                cleanMenu.links.append(Mod_FogFixer())
-            ModList.itemMenu.append(cleanMenu)
-        ModList.itemMenu.append(Mod_CopyToEsmp())
-        if bush.game.fsName == u'Oblivion':
-            ModList.itemMenu.append(Mod_DecompileAll())
-        ModList.itemMenu.append(Mod_FlipEsm())
-        if bush.game.check_esl:
-            ModList.itemMenu.append(Mod_FlipEsl())
-        ModList.itemMenu.append(Mod_FlipMasters())
-        if bush.game.Esp.canBash:
-            ModList.itemMenu.append(Mod_CreateDummyMasters())
-        if bush.game.fsName == u'Oblivion':
-            ModList.itemMenu.append(Mod_SetVersion())
+        ModList.itemMenu.append(_separator)
+        #--Export
+        exportMenu = MenuLink(_(u"Export"))
+        if CBashApi.Enabled:
+            exportMenu.links.append(CBash_Mod_CellBlockInfo_Export())
+        exportMenu.links.append(Mod_EditorIds_Export())
+        exportMenu.links.extend(
+            l() for l in _mod_export_links.get(game_fsName, ()))
+        ModList.itemMenu.append(exportMenu)
+        #--Import
+        importMenu = MenuLink(_(u"Import"))
+        importMenu.links.append(Mod_EditorIds_Import())
+        importMenu.links.extend(
+            l() for l in _mod_import_links.get(game_fsName, ()))
+        ModList.itemMenu.append(importMenu)
+        #--Cleaning
+        cleanMenu = MenuLink(_(u"Mod Cleaning"))
+        cleanMenu.links.extend((Mod_SkipDirtyCheck(), _separator,
+            Mod_ScanDirty(), Mod_RemoveWorldOrphans()))
+        if _IS_OBLIVION:
+            cleanMenu.links.append(Mod_FogFixer())
+        ModList.itemMenu.append(cleanMenu)
+        ModList.itemMenu.extend(l() for l in _mod_advanced_links)
 
 #------------------------------------------------------------------------------
 def InitSaveLinks():
     """Initialize save tab menus."""
+    can_edit_more = bush.game.Ess.canEditMore
     #--SaveList: Column Links
     # Sorting and Columns
-    SaveList.mainMenu.append(SortByMenu())
-    SaveList.mainMenu.append(ColumnsMenu())
-    SaveList.mainMenu.append(SeparatorLink())
+    SaveList.mainMenu.extend((SortByMenu(), ColumnsMenu(), _separator))
     # Files Menu
-    if True:
-        files_menu = MenuLink(_(u'Files..'))
-        files_menu.links.append(UIList_OpenStore())
-        files_menu.links.append(Files_Unhide(u'save'))
-    SaveList.mainMenu.append(files_menu)
-    SaveList.mainMenu.append(SeparatorLink())
-    if True: #--Save Profiles
-        subDirMenu = MenuLink(_(u"Profile"))
-        subDirMenu.links.append(Saves_Profiles())
-        SaveList.mainMenu.append(subDirMenu)
-    if bush.game.fsName == u'Oblivion': #--Versions
-        SaveList.mainMenu.append(SeparatorLink())
-        versionsMenu = MenuLink(u"Oblivion.esm")
-        versionsMenu.links.append(Mods_OblivionVersion(u'1.1',setProfile=True))
-        versionsMenu.links.append(Mods_OblivionVersion(u'1.1b',setProfile=True))
-        versionsMenu.links.append(Mods_OblivionVersion(u'GOTY non-SI',setProfile=True))
-        versionsMenu.links.append(Mods_OblivionVersion(u'SI',setProfile=True))
-        SaveList.mainMenu.append(versionsMenu)
+    SaveList.mainMenu.extend((_build_files_menu(Files_Unhide(u'save')),
+        _separator))
+    #--Save Profiles
+    subDirMenu = MenuLink(_(u"Profile"))
+    subDirMenu.links.append(Saves_Profiles())
+    SaveList.mainMenu.append(subDirMenu)
+    if _IS_OBLIVION: #--Versions
+        SaveList.mainMenu.extend((_separator,
+            _oblivion_versions_menu(set_profile=True)))
     #--SaveList: Item Links
-    if True: #--File
-        file_menu = MenuLink(_(u'File..'))
-        file_menu.links.append(Save_Rename())
-        file_menu.links.append(File_Duplicate())
-        file_menu.links.append(UIList_Hide())
-        file_menu.links.append(balt.UIList_Delete())
-        file_menu.links.append(SeparatorLink())
-        file_menu.links.append(File_Backup())
-        file_menu.links.append(File_RevertToBackup())
-        SaveList.itemMenu.append(file_menu)
-    if True: #--Move to Profile
-        moveMenu = MenuLink(_(u"Move To"))
-        moveMenu.links.append(Save_Move())
-        SaveList.itemMenu.append(moveMenu)
-    if True: #--Copy to Profile
-        copyMenu = MenuLink(_(u"Copy To"))
-        copyMenu.links.append(Save_Move(True))
-        SaveList.itemMenu.append(copyMenu)
+    #--File
+    file_menu = MenuLink(_TR_FILE)
+    file_menu.links.extend((Save_Rename(), File_Duplicate(), UIList_Hide(),
+        balt.UIList_Delete(), _separator, File_Backup(),
+        File_RevertToBackup()))
+    SaveList.itemMenu.append(file_menu)
+    #--Move to Profile
+    moveMenu = MenuLink(_(u"Move To"))
+    moveMenu.links.append(Save_Move())
+    SaveList.itemMenu.append(moveMenu)
+    #--Copy to Profile
+    copyMenu = MenuLink(_(u"Copy To"))
+    copyMenu.links.append(Save_Move(True))
+    SaveList.itemMenu.append(copyMenu)
     #--------------------------------------------
-    SaveList.itemMenu.append(SeparatorLink())
-    SaveList.itemMenu.append(Save_LoadMasters())
-    SaveList.itemMenu.append(File_ListMasters())
-    SaveList.itemMenu.append(Save_DiffMasters())
-    if bush.game.Ess.canEditMore:
+    SaveList.itemMenu.extend((_separator, Save_LoadMasters(),
+        File_ListMasters(), Save_DiffMasters()))
+    if can_edit_more:
         SaveList.itemMenu.append(Save_Stats())
-    SaveList.itemMenu.append(Save_StatObse())
-    SaveList.itemMenu.append(Save_StatPluggy())
-    if bush.game.Ess.canEditMore:
+    SaveList.itemMenu.extend((Save_StatObse(), Save_StatPluggy()))
+    if can_edit_more:
         #--------------------------------------------
-        SaveList.itemMenu.append(SeparatorLink())
-        SaveList.itemMenu.append(Save_EditPCSpells())
-        SaveList.itemMenu.append(Save_RenamePlayer())
-        SaveList.itemMenu.append(Save_EditCreatedEnchantmentCosts())
-        SaveList.itemMenu.append(Save_ImportFace())
-        SaveList.itemMenu.append(Save_EditCreated('ENCH'))
-        SaveList.itemMenu.append(Save_EditCreated('ALCH'))
-        SaveList.itemMenu.append(Save_EditCreated('SPEL'))
-        SaveList.itemMenu.append(Save_ReweighPotions())
-        SaveList.itemMenu.append(Save_UpdateNPCLevels())
+        SaveList.itemMenu.extend((_separator, Save_EditPCSpells(),
+            Save_RenamePlayer(), Save_EditCreatedEnchantmentCosts(),
+            Save_ImportFace(), Save_EditCreated('ENCH'),
+            Save_EditCreated('ALCH'), Save_EditCreated('SPEL'),
+            Save_ReweighPotions(), Save_UpdateNPCLevels()))
     #--------------------------------------------
-    SaveList.itemMenu.append(SeparatorLink())
-    SaveList.itemMenu.append(Save_ExportScreenshot())
-    SaveList.itemMenu.append(Save_Renumber())
+    SaveList.itemMenu.extend((_separator, Save_ExportScreenshot(),
+        Save_Renumber()))
     #--------------------------------------------
-    if bush.game.Ess.canEditMore:
-        SaveList.itemMenu.append(SeparatorLink())
-        SaveList.itemMenu.append(Save_Unbloat())
-        SaveList.itemMenu.append(Save_RepairAbomb())
-        SaveList.itemMenu.append(Save_RepairHair())
+    if can_edit_more:
+        SaveList.itemMenu.extend((_separator, Save_Unbloat(),
+            Save_RepairAbomb(), Save_RepairHair()))
 
 #------------------------------------------------------------------------------
 def InitBSALinks():
     """Initialize BSA tab menus."""
     #--BSAList: Column Links
     # Sorting and Columns
-    BSAList.mainMenu.append(SortByMenu())
-    BSAList.mainMenu.append(ColumnsMenu())
-    BSAList.mainMenu.append(SeparatorLink())
+    BSAList.mainMenu.extend((SortByMenu(), ColumnsMenu(), _separator))
     # Files Menu
-    if True:
-        files_menu = MenuLink(_(u'Files..'))
-        files_menu.links.append(UIList_OpenStore())
-        files_menu.links.append(Files_Unhide(u'BSA'))
-    BSAList.mainMenu.append(files_menu)
-    BSAList.mainMenu.append(SeparatorLink())
+    BSAList.mainMenu.extend((_build_files_menu(Files_Unhide(u'BSA')),
+        _separator))
     #--BSAList: Item Links
-    if True: #--File
-        file_menu = MenuLink(_(u'File..'))
-        file_menu.links.append(File_Duplicate())
-        file_menu.links.append(UIList_Hide())
-        file_menu.links.append(File_Redate())
-        file_menu.links.append(balt.UIList_Delete())
-        file_menu.links.append(SeparatorLink())
-        file_menu.links.append(File_Backup())
-        file_menu.links.append(File_RevertToBackup())
-    BSAList.itemMenu.append(file_menu)
-    BSAList.itemMenu.append(BSA_ExtractToProject())
-    BSAList.itemMenu.append(BSA_ListContents())
+    #--File
+    file_menu = MenuLink(_TR_FILE)
+    file_menu.links.extend((File_Duplicate(), UIList_Hide(), File_Redate(),
+        balt.UIList_Delete(), _separator, File_Backup(),
+        File_RevertToBackup()))
+    BSAList.itemMenu.extend((file_menu, BSA_ExtractToProject(),
+        BSA_ListContents()))
 
 #------------------------------------------------------------------------------
 def InitScreenLinks():
     """Initialize screens tab menus."""
     #--ScreensList: Column Links
     # Sorting and Columns
-    ScreensList.mainMenu.append(SortByMenu())
-    ScreensList.mainMenu.append(ColumnsMenu())
-    ScreensList.mainMenu.append(SeparatorLink())
-    if True:
-        files_menu = MenuLink(_(u'Files..'))
-        files_menu.links.append(UIList_OpenStore())
-        ScreensList.mainMenu.append(files_menu)
-    ScreensList.mainMenu.append(SeparatorLink())
-    ScreensList.mainMenu.append(Screens_NextScreenShot())
+    ScreensList.mainMenu.extend((SortByMenu(), ColumnsMenu(), _separator,
+        _build_files_menu(), _separator, Screens_NextScreenShot()))
     #--JPEG Quality
-    if True:
-        qualityMenu = MenuLink(_(u'JPEG Quality'))
-        for i in range(100, 80, -5):
-            qualityMenu.links.append(Screens_JpgQuality(i))
-        qualityMenu.links.append(Screens_JpgQualityCustom())
-        ScreensList.mainMenu.append(SeparatorLink())
-        ScreensList.mainMenu.append(qualityMenu)
+    ScreensList.mainMenu.extend((_separator, _build_jpeg_quality_menu()))
     #--ScreensList: Item Links
-    if True: #--File
-        file_menu = MenuLink(_(u'File..'))
-        file_menu.links.append(UIList_OpenItems())
-        file_menu.links.append(Screen_Rename())
-        file_menu.links.append(File_Duplicate())
-        file_menu.links.append(balt.UIList_Delete())
-        ScreensList.itemMenu.append(file_menu)
-    if True: #--Convert
-        convertMenu = MenuLink(_(u'Convert'))
-        image_type = Image.typesDict
-        convertMenu.links.append(Screen_ConvertTo(u'jpg', image_type['jpg']))
-        convertMenu.links.append(Screen_ConvertTo(u'png', image_type['png']))
-        convertMenu.links.append(Screen_ConvertTo(u'bmp', image_type['bmp']))
-        convertMenu.links.append(Screen_ConvertTo(u'tif', image_type['tif']))
-        ScreensList.itemMenu.append(convertMenu)
+    #--File
+    file_menu = MenuLink(_TR_FILE)
+    file_menu.links.extend((UIList_OpenItems(), Screen_Rename(),
+        File_Duplicate(), balt.UIList_Delete()))
+    ScreensList.itemMenu.append(file_menu)
+    #--Convert
+    convertMenu = MenuLink(_(u'Convert'))
+    convertMenu.links.extend(Screen_ConvertTo(ext, img_type) for
+                             ext, img_type in _convert_types)
+    ScreensList.itemMenu.append(convertMenu)
 
 #------------------------------------------------------------------------------
 def InitPeopleLinks():
     """Initialize people tab menus."""
     #--Header links
     # Sorting and Columns
-    PeopleList.mainMenu.append(SortByMenu())
-    PeopleList.mainMenu.append(ColumnsMenu())
-    PeopleList.mainMenu.append(SeparatorLink())
-    PeopleList.mainMenu.append(People_AddNew())
-    PeopleList.mainMenu.append(People_Import())
+    PeopleList.mainMenu.extend((SortByMenu(), ColumnsMenu(), _separator,
+        People_AddNew(), People_Import()))
     #--Item links
-    PeopleList.itemMenu.append(People_Karma())
-    PeopleList.itemMenu.append(SeparatorLink())
-    PeopleList.itemMenu.append(People_AddNew())
-    PeopleList.itemMenu.append(balt.UIList_Delete())
-    PeopleList.itemMenu.append(People_Export())
+    PeopleList.itemMenu.extend((People_Karma(), _separator, People_AddNew(),
+        balt.UIList_Delete(), People_Export()))
 
 #------------------------------------------------------------------------------
 def InitSettingsLinks():
     """Initialize settings menu."""
     SettingsMenu = BashStatusBar.SettingsMenu
     #--User settings
-    SettingsMenu.append(Settings_BackupSettings())
-    SettingsMenu.append(Settings_RestoreSettings())
-    SettingsMenu.append(Settings_SaveSettings())
+    SettingsMenu.extend((Settings_BackupSettings(), Settings_RestoreSettings(),
+        Settings_SaveSettings()))
     #--OBSE Dll info
-    SettingsMenu.append(SeparatorLink())
-    SettingsMenu.append(Settings_ExportDllInfo())
-    SettingsMenu.append(Settings_ImportDllInfo())
+    SettingsMenu.extend((_separator, Settings_ExportDllInfo(),
+        Settings_ImportDllInfo()))
     #--Color config
-    SettingsMenu.append(SeparatorLink())
-    SettingsMenu.append(Settings_Colors())
-    if True:
-        tabsMenu = BashNotebook.tabLinks(MenuLink(_(u'Tabs')))
-        SettingsMenu.append(tabsMenu)
+    SettingsMenu.extend((_separator, Settings_Colors()))
+    tabsMenu = BashNotebook.tabLinks(MenuLink(_(u'Tabs')))
+    SettingsMenu.append(tabsMenu)
     #--StatusBar
-    if True:
-        sbMenu = MenuLink(_(u'Status bar'))
-        #--Icon size
-        # FIXME(inf) Either fix these or remove them entirely
-        # if True:
-        #     sizeMenu = MenuLink(_(u'Icon size'))
-        #     for size in (16,24,32):
-        #         sizeMenu.links.append(Settings_IconSize(size))
-        #     sbMenu.links.append(sizeMenu)
-        sbMenu.links.append(Settings_UnHideButtons())
-        sbMenu.links.append(Settings_StatusBar_ShowVersions())
-        SettingsMenu.append(sbMenu)
-    SettingsMenu.append(Settings_Languages())
-    SettingsMenu.append(Settings_PluginEncodings())
-    SettingsMenu.append(Settings_Games())
-    SettingsMenu.append(SeparatorLink())
-    SettingsMenu.append(Settings_UseAltName())
-    SettingsMenu.append(Settings_Deprint())
-    SettingsMenu.append(Settings_DumpTranslator())
-    SettingsMenu.append(Settings_UAC())
+    sbMenu = MenuLink(_(u'Status bar'))
+    #--Icon size
+    # FIXME(inf) Either fix these or remove them entirely
+    # sizeMenu = MenuLink(_(u'Icon size'))
+    # for size in (16,24,32):
+    #     sizeMenu.links.append(Settings_IconSize(size))
+    # sbMenu.links.append(sizeMenu)
+    sbMenu.links.extend((Settings_UnHideButtons(),
+        Settings_StatusBar_ShowVersions()))
+    SettingsMenu.append(sbMenu)
+    SettingsMenu.extend((Settings_Languages(), Settings_PluginEncodings(),
+        Settings_Games(), _separator, Settings_UseAltName(),
+        Settings_Deprint(), Settings_DumpTranslator(), Settings_UAC()))
 
 def InitLinks():
-    """Call other link initializers."""
+    """Call the link initializers needed to build the main window. The tab
+    menus are only shown on right click, so they are initialized later by
+    InitTabLinks."""
     InitStatusBar()
     InitSettingsLinks()
-    InitMasterLinks()
-    InitInstallerLinks()
-    InitINILinks()
-    InitModLinks()
-    InitSaveLinks()
-    InitScreenLinks()
-    InitPeopleLinks()
-    # InitBSALinks()
+
+# Tab link initializers, keyed by the tab keys of basher.tabInfo
+_tab_link_inits = (('Installers', InitInstallerLinks),
+                   ('INI Edits', InitINILinks),
+                   ('Mods', InitModLinks),
+                   ('Saves', InitSaveLinks),
+                   ('Screenshots', InitScreenLinks),
+                   ('People', InitPeopleLinks),
+                   # ('BSAs', InitBSALinks),
+                   )
+_initialized_tabs = set()
+
+def InitTabLinks():
+    """Call the link initializers of the enabled tabs whose menus have not
+    been initialized yet - called again when a hidden tab is shown."""
+    if not _initialized_tabs:
+        InitMasterLinks() # used by Mods, which is always shown
+    tabs_order = bass.settings['bash.tabs.order']
+    for tab_key, init_tab_links in _tab_link_inits:
+        if tab_key not in _initialized_tabs and tabs_order.get(tab_key):
+            init_tab_links()
+            _initialized_tabs.add(tab_key)
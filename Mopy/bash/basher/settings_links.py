@@ -23,14 +23,16 @@
 # =============================================================================
 
 from __future__ import print_function
+import os
 import sys
+from ast import literal_eval
 
 from . import BashStatusBar
 from .dialogs import ColorDialog
-from .. import barb, bush, balt, bass, bolt, env, exception
+from .. import barb, bush, balt, bass, bolt, bosh, env, exception
 from ..balt import ItemLink, AppendableLink, RadioLink, CheckLink, MenuLink, \
     TransLink, EnabledLink, BoolLink, Link
-from ..bolt import deprint, GPath
+from ..bolt import deprint
 from ..exception import BoltError
 from ..gui import BusyCursor
 from ..localize import dump_translator
@@ -148,28 +150,32 @@ def _append(self, window): return bool(bush.game.Se.se_abbrev or
 
     def Execute(self):
         textDir = bass.dirs['patches']
-        textDir.makedirs()
         #--File dialog
         title = _(u'Export list of allowed/disallowed plugin DLLs to:')
         file_ = bush.game.Se.se_abbrev + u' ' + _(u'DLL permissions') + u'.txt'
         textPath = self._askSave(title=title, defaultDir=textDir,
                                  defaultFile=file_, wildcard=u'*.txt')
         if not textPath: return
+        # Look the permissions up only once
+        dll_lists = (
+            (u'goodDlls ' + _(u'(those dlls that you have chosen to allow to '
+                              u'be installed)'),
+             bass.settings['bash.installers.goodDlls']),
+            (u'badDlls ' + _(u'(those dlls that you have chosen to NOT allow '
+                             u'to be installed)'),
+             bass.settings['bash.installers.badDlls']))
+        lines = []
+        for header, dlls in dll_lists:
+            lines.append(header)
+            if dlls:
+                for dll, versions in dlls.iteritems():
+                    lines.append(u'dll:' + dll + u':')
+                    lines.extend(u'version %02d: %s' % (index, version)
+                                 for index, version in enumerate(versions))
+            else: lines.append(u'None')
+        lines.append(u'') # for the final line ending
         with textPath.open('w',encoding='utf-8-sig') as out:
-            out.write(u'goodDlls '+_(u'(those dlls that you have chosen to allow to be installed)')+u'\r\n')
-            if bass.settings['bash.installers.goodDlls']:
-                for dll in bass.settings['bash.installers.goodDlls']:
-                    out.write(u'dll:'+dll+u':\r\n')
-                    for index, version in enumerate(bass.settings['bash.installers.goodDlls'][dll]):
-                        out.write(u'version %02d: %s\r\n' % (index, version))
-            else: out.write(u'None\r\n')
-            out.write(u'badDlls '+_(u'(those dlls that you have chosen to NOT allow to be installed)')+u'\r\n')
-            if bass.settings['bash.installers.badDlls']:
-                for dll in bass.settings['bash.installers.badDlls']:
-                    out.write(u'dll:'+dll+u':\r\n')
-                    for index, version in enumerate(bass.settings['bash.installers.badDlls'][dll]):
-                        out.write(u'version %02d: %s\r\n' % (index, version))
-            else: out.write(u'None\r\n')
+            out.write(u'\r\n'.join(lines))
 
 #------------------------------------------------------------------------------
 class Settings_ImportDllInfo(AppendableLink, ItemLink):
@@ -178,13 +184,13 @@ class Settings_ImportDllInfo(AppendableLink, ItemLink):
         bush.game.Se.se_abbrev
     _help = _(u"Import list of allowed/disallowed plugin DLLs from a txt file"
         u" (for BAIN).")
+    _line_prefixes = (u'goodDlls', u'badDlls', u'dll:', u'version')
 
     def _append(self, window): return bool(bush.game.Se.se_abbrev or
                                            bush.game.Sd.sd_abbrev)
 
     def Execute(self):
         textDir = bass.dirs['patches']
-        textDir.makedirs()
         #--File dialog
         defFile = bush.game.Se.se_abbrev + u' ' + _(
             u'dll permissions') + u'.txt'
@@ -201,26 +207,35 @@ def Execute(self):
                                   _(u'Merge permissions?'))
         try:
             with textPath.open('r',encoding='utf-8-sig') as ins:
-                Dlls = {'goodDlls':{},'badDlls':{}}
-                for line in ins:
-                    line = line.strip()
-                    if line.startswith(u'goodDlls'):
-                        current = Dlls['goodDlls']
-                    if line.startswith(u'badDlls'):
-                        current = Dlls['badDlls']
-                    elif line.startswith(u'dll:'):
-                        dll = line.split(u':',1)[1].strip()
-                        current.setdefault(dll,[])
-                    elif line.startswith(u'version'):
-                        ver = line.split(u':',1)[1]
-                        ver = eval(ver)
-                        current[dll].append(ver)
-                        print(dll,':',ver)
+                lines = ins.read().splitlines()
+            Dlls = {'goodDlls':{},'badDlls':{}}
+            for line in lines:
+                line = line.strip()
+                # skips blank and 'None' lines too
+                if not line.startswith(self._line_prefixes): continue
+                if line.startswith(u'goodDlls'):
+                    current = Dlls['goodDlls']
+                elif line.startswith(u'badDlls'):
+                    current = Dlls['badDlls']
+                elif line.startswith(u'dll:'):
+                    dll = line.split(u':',1)[1].strip()
+                    current.setdefault(dll,[])
+                else: # version
+                    ver = line.split(u':',1)[1]
+                    ver = literal_eval(ver.strip())
+                    current[dll].append(ver)
+                    print(dll,':',ver)
+            settings = bass.settings
             if not replace:
-                bass.settings['bash.installers.goodDlls'].update(Dlls['goodDlls'])
-                bass.settings['bash.installers.badDlls'].update(Dlls['badDlls'])
+                settings['bash.installers.goodDlls'].update(Dlls['goodDlls'])
+                settings['bash.installers.badDlls'].update(Dlls['badDlls'])
             else:
-                bass.settings['bash.installers.goodDlls'], bass.settings['bash.installers.badDlls'] = Dlls['goodDlls'], Dlls['badDlls']
+                settings['bash.installers.goodDlls'] = Dlls['goodDlls']
+                settings['bash.installers.badDlls'] = Dlls['badDlls']
+            # BAIN caches the permissions and its executable skips hold on to
+            # them, so drop the cache and rebuild the skips
+            bosh.bain.Installer.reset_dll_permissions()
+            bosh.bain.Installer.init_global_skips()
         except UnicodeError:
             self._showError(_(u'Wrye Bash could not load %s, because it is not'
                               u' saved in UTF-8 format.  Please resave it in '
@@ -267,23 +282,39 @@ def Execute(self):
         bass.settings['bash.statusbar.showversion'] ^= True
         for button in BashStatusBar.buttons:
             button.set_sb_button_tooltip()
-        if BashStatusBar.obseButton.button_state:
-            BashStatusBar.obseButton.UpdateToolTips()
 
 #------------------------------------------------------------------------------
 class Settings_Languages(TransLink):
     """Menu for available Languages."""
+    _languages = None # cached by _gather_l10n
+
+    @classmethod
+    def _gather_l10n(cls):
+        """Return the links for the languages we have translation files for,
+        sorted by their display text - the l10n directory is only scanned and
+        the links only built on the first call after a reset."""
+        if cls._languages is None:
+            # Work on the plain file names, no need for a Path per file
+            try:
+                fnames = os.listdir(bass.dirs['l10n'].s)
+            except OSError:
+                fnames = []
+            languages = [f[:-4] for f in fnames if f.lower().endswith(u'.txt')
+                         and not f[:-4].lower().endswith(u'new')]
+            lang_links = []
+            if languages:
+                lang_links = [_Settings_Language(lang) for lang in languages]
+                if not any(lang.lower() == u'english' for lang in languages):
+                    lang_links.append(_Settings_Language(u'English'))
+                lang_links.sort(key=lambda l: l._text.lower())
+            cls._languages = lang_links
+        return cls._languages
+
     def _decide(self, window, selection):
-        languages = []
-        for f in bass.dirs['l10n'].list():
-            if f.cext == u'.txt' and f.csbody[-3:] != u'new':
-                languages.append(f.body)
-        if languages:
+        lang_links = self._gather_l10n()
+        if lang_links:
             subMenu = MenuLink(_(u'Language'))
-            for lang in languages:
-                subMenu.links.append(_Settings_Language(lang.s))
-            if GPath('english') not in languages:
-                subMenu.links.append(_Settings_Language('English'))
+            subMenu.links.extend(lang_links)
             return subMenu
         else:
             class _NoLang(EnabledLink):
@@ -305,15 +336,20 @@ class _Settings_Language(EnabledLink, RadioLink):
         u'russian': _(u'Russian') + u' (ру́сский язы́к)',
         u'english': _(u'English') + u' (English)',
         }
+    # the active locale only changes on restart, so lowercase it only once
+    _active_locale_lc = None
 
     def __init__(self, lang):
         super(_Settings_Language, self).__init__()
         self._lang = lang
-        self._text = self.__class__.languageMap.get(self._lang.lower(),
-                                                    self._lang)
+        self._lang_lc = lang.lower()
+        self._text = self.__class__.languageMap.get(self._lang_lc, self._lang)
 
     def _initData(self, window, selection):
-        if bass.active_locale.lower() in self._lang.lower():
+        cls = self.__class__
+        if cls._active_locale_lc is None:
+            cls._active_locale_lc = bass.active_locale.lower()
+        if cls._active_locale_lc in self._lang_lc:
             self._help = _(u"Currently using %(languagename)s as the active "
                           u"language.") % ({'languagename': self._text})
             self.check = True
@@ -348,8 +384,8 @@ def __init__(self):
         self.links.append(Settings_PluginEncoding(_(u'Automatic'),None))
         # self.links.append(SeparatorLink())
         enc_name = sorted(self._plugin_encodings.items(), key=lambda x: x[1])
-        for encoding,name in enc_name:
-            self.links.append(Settings_PluginEncoding(name,encoding))
+        self.links.extend(Settings_PluginEncoding(name, encoding)
+                          for encoding, name in enc_name)
 
 #------------------------------------------------------------------------------
 class Settings_PluginEncoding(RadioLink):
@@ -372,8 +408,8 @@ class Settings_Games(MenuLink):
 
     def __init__(self):
         super(Settings_Games, self).__init__(_(u'Game'))
-        for fsName in bush.foundGames:
-            self.links.append(_Settings_Game(fsName))
+        self.links.extend(_Settings_Game(fsName) for fsName in
+                          bush.foundGames)
 
 class _Settings_Game(RadioLink):
     def __init__(self,game):
@@ -402,15 +438,12 @@ class Settings_UnHideButtons(TransLink):
     """Menu to unhide a StatusBar button."""
 
     def _decide(self, window, selection):
-        hide = bass.settings['bash.statusbar.hide']
-        hidden = []
-        for link in BashStatusBar.buttons:
-            if link.uid in hide:
-                hidden.append(link)
+        hide = bass.settings['bash.statusbar.hide'] # a set
+        hidden = [link for link in BashStatusBar.buttons if link.uid in hide]
         if hidden:
             subMenu = MenuLink(_(u'Unhide Buttons'))
-            for link in hidden:
-                subMenu.links.append(Settings_UnHideButton(link))
+            subMenu.links.extend(Settings_UnHideButton(link) for link in
+                                 hidden)
             return subMenu
         else:
             class _NoButtons(EnabledLink):
@@ -497,5 +530,6 @@ def Execute(self):
         outPath = bass.dirs['l10n']
         with BusyCursor():
             outFile = dump_translator(outPath.s, bass.active_locale)
+        Settings_Languages._languages = None # rescan the l10n directory
         self._showOk(_(u'Translation keys written to %s') % outFile,
                      self._text + u': ' + outPath.stail)
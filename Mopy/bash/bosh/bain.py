@@ -389,6 +389,12 @@ def badDlls():
             Installer._badDlls = collections.defaultdict(list)
             Installer._badDlls.update(bass.settings['bash.installers.badDlls'])
         return Installer._badDlls
+    @staticmethod
+    def reset_dll_permissions():
+        """Drop the cached DLL permissions so that they are rebuilt from the
+        settings on next use. Call init_global_skips afterwards, the
+        executable skips keep references to the old permissions."""
+        Installer._goodDlls = Installer._badDlls = None
     # while checking for skips process some installer attributes
     _attributes_process = {}
     _extensions_to_process = set()
@@ -37,6 +37,12 @@
 from . import exception
 from .bolt import decode, encode, sio, GPath, struct_pack, struct_unpack
 
+# Precompiled group header structs used by ModWriter.writeGroup, keyed by the
+# type of the group label (top type, exterior block or fid/integer)
+_grup_str_label = struct.Struct(u'=4sI4sII')
+_grup_block_label = struct.Struct(u'=4sIhhII')
+_grup_int_label = struct.Struct(u'=4s4I')
+
 # Util Functions --------------------------------------------------------------
 #--Type coercion
 def _coerce(value, newtype, base=None, AllowNone=False):
@@ -157,6 +163,9 @@ def unpack(ins):
         if rec_type not in RecordHeader.recordTypes:
             raise exception.ModError(ins.inName,
                                      u'Bad header type: ' + repr(rec_type))
+        # Intern the signature, so that comparing it with the signature
+        # literals in the loading loops succeeds on identity alone
+        rec_type = intern(rec_type) # PY3: sys.intern
         #--Record
         if rec_type != 'GRUP':
             pass
@@ -169,7 +178,7 @@ def unpack(ins):
             else:
                 raise exception.ModError(ins.inName,
                                          u'Bad Top GRUP type: ' + repr(str0))
-        return RecordHeader(*args)
+        return RecordHeader(rec_type, *args[1:])
 
     def pack(self):
         """Return the record header packed into a bitstream to be written to
@@ -411,11 +420,14 @@ def packRef(self, sub_rec_type, fid):
 
     def writeGroup(self,size,label,groupType,stamp):
         if type(label) is str:
-            self.pack('=4sI4sII','GRUP',size,label,groupType,stamp)
+            self.out.write(_grup_str_label.pack('GRUP', size, label, groupType,
+                                                stamp))
         elif type(label) is tuple:
-            self.pack('=4sIhhII','GRUP',size,label[1],label[0],groupType,stamp)
+            self.out.write(_grup_block_label.pack('GRUP', size, label[1],
+                                                  label[0], groupType, stamp))
         else:
-            self.pack('=4s4I','GRUP',size,label,groupType,stamp)
+            self.out.write(_grup_int_label.pack('GRUP', size, label, groupType,
+                                                stamp))
 
     def write_string(self, sub_type, string_val, max_size=0, min_size=0,
                      preferred_encoding=None):
@@ -1872,11 +1884,12 @@ def convertFids(self,record, mapper,toLong):
     def updateMasters(self,record,masters):
         """Updates set of master names according to masters actually used."""
         if not record.longFids: raise exception.StateError("Fids not in long format")
-        def updater(fid):
-            masters.add(fid)
-        updater(record.fid)
+        # mapFids ignores the result when not saving, so feed fids straight
+        # to the set instead of through a wrapper function
+        masters_add = masters.add
+        masters_add(record.fid)
         for element in self.formElements:
-            element.mapFids(record,updater)
+            element.mapFids(record,masters_add)
 
     def with_distributor(self, distributor_config):
         # type: (dict) -> MelSet
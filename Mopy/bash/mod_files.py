@@ -277,7 +277,9 @@ def save(self,outPath=None):
         outPath -- Path of the output file to write to. Defaults to original file path."""
         if not self.loadFactory.keepAll: raise StateError(u"Insufficient data to write file.")
         outPath = outPath or self.fileInfo.getPath()
-        with ModWriter(outPath.open(u'wb')) as out:
+        # Records are dumped as many small header/data writes - use a 1 MB
+        # buffer so those are batched into few actual writes to disk
+        with ModWriter(outPath.open(u'wb', 0x100000)) as out:
             #--Mod Record
             self.tes4.setChanged()
             self.tes4.numRecords = sum(block.getNumRecords() for block in self.tops.values())
@@ -270,6 +270,13 @@ def mergeModFile(self,modFile,progress,doFilter,iiMode):
         selfReadFactoryAddClass = self.readFactory.addClass
         selfLoadFactoryAddClass = self.loadFactory.addClass
         nullFid = (bosh.modInfos.masterName, 0)
+        masters = MasterSet() # reused for every record, see below
+        loadSetIssuperset = loadSet.issuperset
+        # Records can only point to the plugin's masters or itself - if all
+        # of those are loaded, filtering would not change or skip anything
+        if doFilter and loadSetIssuperset(
+                modFile.tes4.masters + [modFile.fileInfo.name]):
+            doFilter = False
         for blockType,block in modFile.tops.iteritems():
             iiSkipMerge = iiMode and blockType not in bush.game.listTypes
             #--Make sure block type is also in read and write factories
@@ -283,14 +290,13 @@ def mergeModFile(self,modFile,progress,doFilter,iiMode):
                 raise BoltError(u"Merge unsupported for type: "+blockType)
             filtered = []
             filteredAppend = filtered.append
-            loadSetIssuperset = loadSet.issuperset
             for record in block.getActiveRecords():
                 fid = record.fid
                 if fid == badForm: continue
                 #--Include this record?
                 if doFilter:
                     record.mergeFilter(loadSet)
-                    masters = MasterSet()
+                    masters.clear()
                     record.updateMasters(masters)
                     if not loadSetIssuperset(masters):
                         continue
@@ -25,10 +25,12 @@
 """Classes that group records."""
 # Python imports
 from __future__ import division, print_function
+import struct
+from itertools import chain
 from operator import itemgetter
 # Wrye Bash imports
 from .brec import ModReader, RecordHeader
-from .bolt import sio, struct_pack, struct_unpack
+from .bolt import sio
 from . import bush # for fallout3/nv fsName
 from .exception import AbstractError, ArgumentError, ModError
 
@@ -47,6 +49,28 @@
     _(u'Cell Visible Distant Children'),
 ]
 
+# Type and size of a record or group header
+_unpack_type_size = struct.Struct(u'=4sI').unpack_from
+
+def _exterior_block(groupFid):
+    """Returns the block of an exterior cell block group in MobCell.getBsb
+    order, i.e. the two signed 16 bit halves of its label, high half first."""
+    high, low = groupFid >> 16 & 0xFFFF, groupFid & 0xFFFF
+    if high & 0x8000: high -= 0x10000
+    if low & 0x8000: low -= 0x10000
+    return high, low
+
+def _keep_in_place(records, keepIds):
+    """Removes the records whose fid is not in keepIds from the list
+    records, moving the kept ones down instead of building a new list."""
+    keep = keepIds.__contains__
+    write = 0
+    for record in records:
+        if keep(record.fid):
+            records[write] = record
+            write += 1
+    del records[write:]
+
 class MobBase(object):
     """Group of records and/or subgroups. This basic implementation does not
     support unpacking, but can report its number of records and be written."""
@@ -76,7 +100,8 @@ def load(self, ins=None, do_unpack=False):
         if self.debug: print(u'GRUP load:',self.label)
         #--Read, but don't analyze.
         if not do_unpack:
-            self.data = ins.read(self.size - self.header.__class__.rec_header_size, type(self))
+            self.data = ins.read(
+                self.size - self.header.__class__.rec_header_size, 'GRUP')
         #--Analyze ins.
         elif ins is not None:
             self.loadData(ins,
@@ -114,18 +139,24 @@ def getNumRecords(self,includeGroups=True):
             self.numRecords = 0
             return self.numRecords
         else:
-            numSubRecords = 0
-            reader = self.getReader()
-            errLabel = groupTypes[self.groupType]
-            readerAtEnd = reader.atEnd
-            readerRecHeader = reader.unpackRecHeader
-            readerSeek = reader.seek
-            while not readerAtEnd(reader.size,errLabel):
-                header = readerRecHeader()
-                recType,size = header.recType,header.size
-                if recType == 'GRUP': size = 0
-                readerSeek(size,1)
+            # Walk the raw headers, we only need their type and size
+            data = self.data
+            data_size = len(data)
+            hsize = RecordHeader.rec_header_size
+            recordTypes = RecordHeader.recordTypes
+            unpack_type_size = _unpack_type_size
+            pos = numSubRecords = 0
+            while pos < data_size:
+                if pos + hsize > data_size: break # truncated header
+                recType, size = unpack_type_size(data, pos)
+                if recType not in recordTypes:
+                    raise ModError(self.inName,
+                                   u'Bad header type: ' + repr(recType))
+                pos += hsize if recType == 'GRUP' else hsize + size
                 numSubRecords += 1
+            if pos != data_size:
+                raise ModError(self.inName, u'Exceeded limit of: ' +
+                               groupTypes[self.groupType])
             self.numRecords = numSubRecords + includeGroups
             return self.numRecords
 
@@ -163,6 +194,7 @@ class MobObjects(MobBase):
     def __init__(self, header, loadFactory, ins=None, do_unpack=False):
         self.records = []
         self.id_records = {}
+        self._id_index = {} # fid -> cached position in self.records
         MobBase.__init__(self, header, loadFactory, ins, do_unpack)
 
     def loadData(self,ins,endPos):
@@ -201,9 +233,10 @@ def getSize(self):
         if not self.changed:
             return self.size
         else:
-            hsize = RecordHeader.rec_header_size
-            return hsize + sum(
-                (hsize + record.getSize()) for record in self.records)
+            # one header per record plus our own - records cache their size
+            records = self.records
+            return RecordHeader.rec_header_size * (len(records) + 1) + sum(
+                [record.getSize() for record in records])
 
     def dump(self,out):
         """Dumps group header and then records."""
@@ -231,12 +264,15 @@ def convertFids(self,mapper,toLong):
         for record in self.records:
             record.convertFids(mapper,toLong)
         self.id_records.clear()
+        self._id_index.clear()
 
     def indexRecords(self):
         """Indexes records by fid."""
         self.id_records.clear()
-        for record in self.records:
+        self._id_index.clear()
+        for index, record in enumerate(self.records):
             self.id_records[record.fid] = record
+            self._id_index[record.fid] = index
 
     def getRecord(self,fid,default=None):
         """Gets record with corresponding id.
@@ -263,26 +299,37 @@ def setRecord(self,record):
         if record.isKeyedByEid:
             if record_id == (bosh.modInfos.masterName, 0):
                 record_id = record.eid
+        records = self.records
         if record_id in self.id_records:
             oldRecord = self.id_records[record_id]
-            index = self.records.index(oldRecord)
-            self.records[index] = record
+            # records may be reassigned or reordered behind our back, so
+            # only trust the cached position if it still holds oldRecord
+            index = self._id_index.get(record_id)
+            if index is None or index >= len(records) or \
+                    records[index] is not oldRecord:
+                index = records.index(oldRecord)
+            records[index] = record
         else:
-            self.records.append(record)
+            index = len(records)
+            records.append(record)
         self.id_records[record_id] = record
+        self._id_index[record_id] = index
 
     def keepRecords(self,keepIds):
         """Keeps records with fid in set keepIds. Discards the rest."""
         from . import bosh
-        self.records = [record for record in self.records if (record.fid == (
-            record.isKeyedByEid and bosh.modInfos.masterName,
-            0) and record.eid in keepIds) or record.fid in keepIds]
+        nullFid = (bosh.modInfos.masterName, 0)
+        self.records = [record for record in self.records if (
+            record.isKeyedByEid and record.fid == nullFid and
+            record.eid in keepIds) or record.fid in keepIds]
         self.id_records.clear()
+        self._id_index.clear()
         self.setChanged()
 
     def updateRecords(self,srcBlock,mapper,mergeIds):
         """Looks through all of the records in 'srcBlock', and updates any
         records in self that exist within the data in 'block'."""
+        # Not id_records - setRecord keys null fid eid-keyed records by eid
         fids = set([record.fid for record in self.records])
         for record in srcBlock.getActiveRecords():
             if mapper(record.fid) in fids:
@@ -348,28 +395,31 @@ def getSize(self):
         if not self.changed:
             return self.size
         hsize = RecordHeader.rec_header_size
-        size = hsize
+        size = hsize * (len(self.records) + 1)
         for record in self.records:
-            size += hsize + record.getSize()
-            if record.infos:
-                size += hsize + sum(
-                    hsize + info.getSize() for info in record.infos)
+            size += record.getSize()
+            infos = record.infos
+            if infos: # infos GRUP header plus one header per info
+                size += hsize * (len(infos) + 1) + sum(
+                    [info.getSize() for info in infos])
         return size
 
     def getNumRecords(self,includeGroups=1):
         """Returns number of records, including self plus info records."""
-        self.numRecords = (
-            len(self.records) + includeGroups * bool(self.records) +
-            sum((includeGroups + len(x.infos)) for x in self.records if
-                x.infos)
-        )
-        return self.numRecords
+        numRecords = len(self.records)
+        if numRecords: numRecords += includeGroups #--Count self
+        for record in self.records:
+            infos = record.infos
+            if infos: numRecords += includeGroups + len(infos)
+        self.numRecords = numRecords
+        return numRecords
 
 #------------------------------------------------------------------------------
 class MobCell(MobBase):
     """Represents cell block structure -- including the cell and all
     subrecords."""
-    __slots__ = ['cell','persistent','distant','temp', 'land','pgrd']
+    __slots__ = ['cell','persistent','distant','temp', 'land','pgrd',
+                 '_fid_indices']
 
     def __init__(self, header, loadFactory, cell, ins=None, do_unpack=False):
         self.cell = cell
@@ -378,8 +428,16 @@ def __init__(self, header, loadFactory, cell, ins=None, do_unpack=False):
         self.temp = []
         self.land = None
         self.pgrd = None
+        # (list, fid -> index) for persistent, temp and distant
+        self._fid_indices = [None, None, None]
         MobBase.__init__(self, header, loadFactory, ins, do_unpack)
 
+    def setChanged(self,value=True):
+        """Sets changed attribute to value. [Default = True.] Also drops
+        the cached fid indices of the children lists."""
+        self.changed = value
+        self._fid_indices = [None, None, None]
+
     def loadData(self,ins,endPos):
         """Loads data from input stream. Called by load()."""
         cellType_class = self.loadFactory.getCellTypeClass()
@@ -391,8 +449,8 @@ def loadData(self,ins,endPos):
         tempAppend = temp.append
         distantAppend = distant.append
         insSeek = ins.seek
+        subgroupLoaded = [False,False,False]
         while not insAtEnd(endPos,'Cell Block'):
-            subgroupLoaded = [False,False,False]
             header = insRecHeader()
             recType = header.recType
             recClass = cellGet(recType)
@@ -479,28 +537,34 @@ def getBsb(self):
         cell = self.cell
         #--Interior cell
         if cell.flags.isInterior:
-            baseFid = cell.fid & 0x00FFFFFF
-            return baseFid%10, baseFid%100//10
+            lastTwo = (cell.fid & 0x00FFFFFF) % 100
+            return lastTwo % 10, lastTwo // 10
         #--Exterior cell
         else:
             x,y = cell.posY,cell.posX
             if x is None: x = 0
             if y is None: y = 0
-            return (x//32, y//32), (x//8, y//8)
+            # Arithmetic shifts floor like // does, negative coords included
+            return (x >> 5, y >> 5), (x >> 3, y >> 3)
 
     def dump(self,out):
         """Dumps group header and then records."""
         self.cell.getSize()
         self.cell.dump(out)
-        childrenSize = self.getChildrenSize()
+        # Size the children groups once, getChildrenSize would do it again
+        persistentSize = self.getPersistentSize()
+        tempSize = self.getTempSize()
+        distantSize = self.getDistantSize()
+        childrenSize = persistentSize + tempSize + distantSize
         if not childrenSize: return
+        childrenSize += RecordHeader.rec_header_size
         out.writeGroup(childrenSize,self.cell.fid,6,self.stamp)
         if self.persistent:
-            out.writeGroup(self.getPersistentSize(),self.cell.fid,8,self.stamp)
+            out.writeGroup(persistentSize,self.cell.fid,8,self.stamp)
             for record in self.persistent:
                 record.dump(out)
         if self.temp or self.pgrd or self.land:
-            out.writeGroup(self.getTempSize(),self.cell.fid,9,self.stamp)
+            out.writeGroup(tempSize,self.cell.fid,9,self.stamp)
             if self.pgrd:
                 self.pgrd.dump(out)
             if self.land:
@@ -508,7 +572,7 @@ def dump(self,out):
             for record in self.temp:
                 record.dump(out)
         if self.distant:
-            out.writeGroup(self.getDistantSize(),self.cell.fid,10,self.stamp)
+            out.writeGroup(distantSize,self.cell.fid,10,self.stamp)
             for record in self.distant:
                 record.dump(out)
 
@@ -518,12 +582,9 @@ def convertFids(self,mapper,toLong):
         toLong should be True if converting to long format or False if
         converting to short format."""
         self.cell.convertFids(mapper,toLong)
-        for record in self.temp:
-            record.convertFids(mapper,toLong)
-        for record in self.persistent:
-            record.convertFids(mapper,toLong)
-        for record in self.distant:
+        for record in chain(self.temp, self.persistent, self.distant):
             record.convertFids(mapper,toLong)
+        self._fid_indices = [None, None, None]
         if self.land:
             self.land.convertFids(mapper,toLong)
         if self.pgrd:
@@ -532,11 +593,7 @@ def convertFids(self,mapper,toLong):
     def updateMasters(self,masters):
         """Updates set of master names according to masters actually used."""
         self.cell.updateMasters(masters)
-        for record in self.persistent:
-            record.updateMasters(masters)
-        for record in self.distant:
-            record.updateMasters(masters)
-        for record in self.temp:
+        for record in chain(self.persistent, self.distant, self.temp):
             record.updateMasters(masters)
         if self.land:
             self.land.updateMasters(masters)
@@ -546,29 +603,65 @@ def updateMasters(self,masters):
     def updateRecords(self,srcBlock,mapper,mergeIds):
         """Updates any records in 'self' that exist in 'srcBlock'."""
         mergeDiscard = mergeIds.discard
-        selfGetter = self.__getattribute__
-        srcGetter = srcBlock.__getattribute__
-        selfSetter = self.__setattr__
-        for attr in ('cell','pgrd','land'):
-            myRecord = selfGetter(attr)
-            record = srcGetter(attr)
-            if myRecord and record:
-                if myRecord.fid != mapper(record.fid):
-                    raise ArgumentError(u"Fids don't match! %08x, %08x" % (
-                        myRecord.fid,record.fid))
-                if not record.flags1.ignored:
-                    record = record.getTypeCopy(mapper)
-                    selfSetter(attr,record)
-                    mergeDiscard(record.fid)
-        for attr in ('persistent','temp','distant'):
-            recordList = selfGetter(attr)
-            fids = dict(
-                (record.fid,index) for index,record in enumerate(recordList))
-            for record in srcGetter(attr):
-                if not record.flags1.ignored and mapper(record.fid) in fids:
-                    record = record.getTypeCopy(mapper)
-                    recordList[fids[record.fid]] = record
-                    mergeDiscard(record.fid)
+        # The cell, pgrd and land are handled one by one on purpose, going
+        # through getattr/setattr for them was measurably slower
+        myRecord, record = self.cell, srcBlock.cell
+        if myRecord and record:
+            if myRecord.fid != mapper(record.fid):
+                raise ArgumentError(u"Fids don't match! %08x, %08x" % (
+                    myRecord.fid,record.fid))
+            if not record.flags1.ignored:
+                record = self.cell = record.getTypeCopy(mapper)
+                mergeDiscard(record.fid)
+        myRecord, record = self.pgrd, srcBlock.pgrd
+        if myRecord and record:
+            if myRecord.fid != mapper(record.fid):
+                raise ArgumentError(u"Fids don't match! %08x, %08x" % (
+                    myRecord.fid,record.fid))
+            if not record.flags1.ignored:
+                record = self.pgrd = record.getTypeCopy(mapper)
+                mergeDiscard(record.fid)
+        myRecord, record = self.land, srcBlock.land
+        if myRecord and record:
+            if myRecord.fid != mapper(record.fid):
+                raise ArgumentError(u"Fids don't match! %08x, %08x" % (
+                    myRecord.fid,record.fid))
+            if not record.flags1.ignored:
+                record = self.land = record.getTypeCopy(mapper)
+                mergeDiscard(record.fid)
+        for list_index, recordList, srcList in (
+                (0, self.persistent, srcBlock.persistent),
+                (1, self.temp, srcBlock.temp),
+                (2, self.distant, srcBlock.distant)):
+            fids, fresh = self._get_fid_index(list_index, recordList)
+            for record in srcList:
+                if record.flags1.ignored: continue
+                fid = mapper(record.fid)
+                index = fids.get(fid)
+                if not fresh and (index is None or index >= len(recordList)
+                                  or recordList[index].fid != fid):
+                    # Patchers edit these lists directly, so a miss or a
+                    # wrong hit on a cached index may be stale - reindex once
+                    self._fid_indices[list_index] = None
+                    fids, fresh = self._get_fid_index(list_index, recordList)
+                    index = fids.get(fid)
+                if index is None: continue
+                recordList[index] = record.getTypeCopy(mapper)
+                mergeDiscard(fid)
+
+    def _get_fid_index(self, list_index, recordList):
+        """Returns a fid -> position dict for recordList and whether it was
+        just built. The dict built by a previous call is reused until it is
+        dropped (see setChanged and convertFids) or the list is replaced -
+        callers must rebuild a reused dict on a miss or a wrong hit, as
+        patchers may have edited the list directly."""
+        cached = self._fid_indices[list_index]
+        if cached and cached[0] is recordList:
+            return cached[1], False
+        fids = dict(
+            (record.fid,index) for index,record in enumerate(recordList))
+        self._fid_indices[list_index] = (recordList, fids)
+        return fids, True
 
     def keepRecords(self,keepIds):
         """Keeps records with fid in set keepIds. Discards the rest."""
@@ -576,9 +669,9 @@ def keepRecords(self,keepIds):
             self.pgrd = None
         if self.land and self.land.fid not in keepIds:
             self.land = None
-        self.temp       = [x for x in self.temp if x.fid in keepIds]
-        self.persistent = [x for x in self.persistent if x.fid in keepIds]
-        self.distant    = [x for x in self.distant if x.fid in keepIds]
+        # Usually few records are dropped, so filter the lists in place
+        for recordList in (self.temp, self.persistent, self.distant):
+            _keep_in_place(recordList, keepIds)
         if self.pgrd or self.land or self.persistent or self.temp or \
                 self.distant:
             keepIds.add(self.cell.fid)
@@ -620,7 +713,7 @@ def setCell(self,cell):
 
     def getUsedBlocks(self):
         """Returns a set of blocks that exist in this group."""
-        return set(x.getBsb()[0] for x in self.cellBlocks)
+        return set(bsb[0] for bsb in self.getUsedSubblocks())
 
     def getUsedSubblocks(self):
         """Returns a set of block/sub-blocks that exist in this group."""
@@ -629,22 +722,24 @@ def getUsedSubblocks(self):
     def getBsbSizes(self):
         """Returns the total size of the block, but also returns a
         dictionary containing the sizes of the individual block,subblocks."""
-        bsbCellBlocks = [(x.getBsb(),x) for x in self.cellBlocks]
-        bsbCellBlocks.sort(key = lambda y: y[1].cell.fid)
-        bsbCellBlocks.sort(key = itemgetter(0))
+        # Sort by bsb, then by cell fid - a single sort on a decorated list
+        decorated = [(x.getBsb(), x.cell.fid, x) for x in self.cellBlocks]
+        decorated.sort(key=itemgetter(0, 1))
+        bsbCellBlocks = [(bsb, x) for bsb, _fid, x in decorated]
         bsb_size = {}
         hsize = RecordHeader.rec_header_size
         totalSize = hsize
-        bsb_setDefault = bsb_size.setdefault
         for bsb,cellBlock in bsbCellBlocks:
             cellBlockSize = cellBlock.getSize()
             totalSize += cellBlockSize
             bsb0 = (bsb[0],None) #--Block group
-            bsb_setDefault(bsb0,hsize)
-            if bsb_setDefault(bsb, hsize) == hsize:
-                bsb_size[bsb0] += hsize
-            bsb_size[bsb] += cellBlockSize
-            bsb_size[bsb0] += cellBlockSize
+            if bsb in bsb_size:
+                bsb_size[bsb] += cellBlockSize
+                bsb_size[bsb0] += cellBlockSize
+            else: # new subblock, maybe new block - account for their headers
+                bsb_size[bsb] = hsize + cellBlockSize
+                bsb_size[bsb0] = bsb_size.get(bsb0, hsize) + hsize + \
+                                 cellBlockSize
         totalSize += hsize * len(bsb_size)
         return totalSize,bsb_size,bsbCellBlocks
 
@@ -656,25 +751,44 @@ def dumpBlocks(self,out,bsbCellBlocks,bsb_size,blockGroupType,
         curSubblock = None
         stamp = self.stamp
         outWrite = out.write
+        # Pack the (sub-)block group headers directly, instead of creating a
+        # RecordHeader for each one. The formats depend on the game, so the
+        # structs are compiled here rather than at module scope. Exterior
+        # labels are tuples of two shorts, interior ones plain ints
+        pack_formats = RecordHeader.pack_formats
+        packBlock = struct.Struct(pack_formats[blockGroupType]).pack
+        packSubblock = struct.Struct(pack_formats[subBlockGroupType]).pack
+        extra = (0,) if RecordHeader.plugin_form_version else ()
+        blockTail = (blockGroupType, stamp) + extra
+        subblockTail = (subBlockGroupType, stamp) + extra
         for bsb,cellBlock in bsbCellBlocks:
             (block,subblock) = bsb
             bsb0 = (block,None)
             if block != curBlock:
                 curBlock,curSubblock = bsb0
-                outWrite(RecordHeader('GRUP',bsb_size[bsb0],block,
-                                      blockGroupType,stamp).pack())
+                label = block if type(block) is tuple else (block,)
+                outWrite(packBlock('GRUP', bsb_size[bsb0],
+                                   *(label + blockTail)))
             if subblock != curSubblock:
                 curSubblock = subblock
-                outWrite(RecordHeader('GRUP',bsb_size[bsb],subblock,
-                                      subBlockGroupType,stamp).pack())
+                label = subblock if type(subblock) is tuple else (subblock,)
+                outWrite(packSubblock('GRUP', bsb_size[bsb],
+                                      *(label + subblockTail)))
             cellBlock.dump(out)
 
     def getNumRecords(self,includeGroups=1):
         """Returns number of records, including self and all children."""
-        count = sum(x.getNumRecords(includeGroups) for x in self.cellBlocks)
+        # Count records and collect the used (sub-)blocks in a single pass
+        count = 0
+        usedBlocks, usedSubblocks = set(), set()
+        for cellBlock in self.cellBlocks:
+            count += cellBlock.getNumRecords(includeGroups)
+            if includeGroups:
+                bsb = cellBlock.getBsb()
+                usedSubblocks.add(bsb)
+                usedBlocks.add(bsb[0])
         if count and includeGroups:
-            count += 1 + len(self.getUsedBlocks()) + len(
-                self.getUsedSubblocks())
+            count += 1 + len(usedBlocks) + len(usedSubblocks)
         return count
 
     #--Fid manipulation, record filtering ----------------------------------
@@ -683,8 +797,16 @@ def keepRecords(self,keepIds):
         #--Note: this call will add the cell to keepIds if any of its
         # related records are kept.
         for cellBlock in self.cellBlocks: cellBlock.keepRecords(keepIds)
-        self.cellBlocks = [x for x in self.cellBlocks if x.cell.fid in keepIds]
-        self.id_cellBlock.clear()
+        # Drop the discarded cells from the index rather than rebuilding it
+        id_cellBlock_pop = self.id_cellBlock.pop
+        kept = []
+        for cellBlock in self.cellBlocks:
+            fid = cellBlock.cell.fid
+            if fid in keepIds:
+                kept.append(cellBlock)
+            else:
+                id_cellBlock_pop(fid, None)
+        self.cellBlocks = kept
         self.setChanged()
 
     def convertFids(self,mapper,toLong):
@@ -747,11 +869,8 @@ def loadData(self,ins,endPos):
                 size,groupFid,groupType = header.size,header.label, \
                                           header.groupType
                 delta = size - header.__class__.rec_header_size
-                if groupType == 2: # Block number
-                    endBlockPos = insTell() + delta
-                elif groupType == 3: # Sub-block number
-                    endSubblockPos = insTell() + delta
-                elif groupType == 6: # Cell Children
+                # Cell children groups are by far the most common ones
+                if groupType == 6: # Cell Children
                     if cell:
                         if groupFid != cell.fid:
                             raise ModError(self.inName,
@@ -770,6 +889,10 @@ def loadData(self,ins,endPos):
                         raise ModError(self.inName,
                                        u'Extra subgroup %d in CELL group.' %
                                        groupType)
+                elif groupType == 2: # Block number
+                    endBlockPos = insTell() + delta
+                elif groupType == 3: # Sub-block number
+                    endSubblockPos = insTell() + delta
                 else:
                     raise ModError(self.inName,
                                    u'Unexpected subgroup %d in CELL group.'
@@ -829,10 +952,9 @@ def loadData(self,ins,endPos):
             recType,size = header.recType,header.size
             delta = size - header.__class__.rec_header_size
             recClass = cellGet(recType)
-            if recType == 'ROAD':
-                if not recClass: insSeek(size,1)
-                else: self.road = recClass(header,ins,True)
-            elif recType == 'CELL':
+            # Branches are ordered by how common the header is: one CELL and
+            # one children GRUP per cell, a single ROAD per world
+            if recType == 'CELL':
                 if cell:
                     cellBlock = MobCell(header,selfLoadFactory,cell)
                     if block:
@@ -865,17 +987,7 @@ def loadData(self,ins,endPos):
                                            hex(cell.fid),cell.eid))
             elif recType == 'GRUP':
                 groupFid,groupType = header.label,header.groupType
-                if groupType == 4: # Exterior Cell Block
-                    block = struct_unpack('2h', struct_pack('I', groupFid))
-                    block = (block[1],block[0])
-                    endBlockPos = insTell() + delta
-                elif groupType == 5: # Exterior Cell Sub-Block
-                    # we don't actually care what the sub-block is, since
-                    # we never use that information here. So below was unused:
-                    # subblock = structUnpack('2h',structPack('I',groupFid))
-                    # subblock = (subblock[1],subblock[0]) # unused var
-                    endSubblockPos = insTell() + delta
-                elif groupType == 6: # Cell Children
+                if groupType == 6: # Cell Children
                     if isFallout: cell = cells.get(groupFid,None)
                     if cell:
                         if groupFid != cell.fid:
@@ -904,10 +1016,22 @@ def loadData(self,ins,endPos):
                         raise ModError(self.inName,
                                        u'Extra cell children subgroup in '
                                        u'world children group.')
+                elif groupType == 4: # Exterior Cell Block
+                    block = _exterior_block(groupFid)
+                    endBlockPos = insTell() + delta
+                elif groupType == 5: # Exterior Cell Sub-Block
+                    # we don't actually care what the sub-block is, since
+                    # we never use that information here. So below was unused:
+                    # subblock = structUnpack('2h',structPack('I',groupFid))
+                    # subblock = (subblock[1],subblock[0]) # unused var
+                    endSubblockPos = insTell() + delta
                 else:
                     raise ModError(self.inName,
                                    u'Unexpected subgroup %d in world '
                                    u'children group.' % groupType)
+            elif recType == 'ROAD':
+                if not recClass: insSeek(size,1)
+                else: self.road = recClass(header,ins,True)
             else:
                 raise ModError(self.inName,
                                u'Unexpected %s record in world children '
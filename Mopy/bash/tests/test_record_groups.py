@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# GPL License and Copyright Notice ============================================
+#  This file is part of Wrye Bash.
+#
+#  Wrye Bash is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  Wrye Bash is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with Wrye Bash; if not, write to the Free Software Foundation,
+#  Inc., 59 Temple Place - Suite 330, Boston, MA  02111-1307, USA.
+#
+#  Wrye Bash copyright (C) 2005-2009 Wrye, 2010-2020 Wrye Bash Team
+#  https://github.com/wrye-bash
+#
+# =============================================================================
+from ..brec import RecordHeader
+from ..record_groups import MobCell
+
+class _Flags(object):
+    ignored = False
+
+class _Record(object):
+    """Bare minimum of a reference record that MobCell.updateRecords uses."""
+    def __init__(self, fid, is_copy=False):
+        self.fid = fid
+        self.is_copy = is_copy
+        self.flags1 = _Flags()
+
+    def getTypeCopy(self, mapper):
+        return _Record(mapper(self.fid), is_copy=True)
+
+def _cell_block(*temp_fids):
+    cell_block = MobCell(RecordHeader('GRUP', 0, 0, 6, 0), None, _Record(1))
+    cell_block.temp.extend(_Record(fid) for fid in temp_fids)
+    return cell_block
+
+def _identity(fid): return fid
+
+class TestMobCellUpdateRecords(object):
+    def test_update_replaces_matching_refs(self):
+        cell_block = _cell_block(10, 11)
+        merge_ids = {10, 11}
+        cell_block.updateRecords(_cell_block(11, 12), _identity, merge_ids)
+        assert [r.fid for r in cell_block.temp] == [10, 11]
+        assert [r.is_copy for r in cell_block.temp] == [False, True]
+        assert merge_ids == {10}
+
+    def test_replace_at_same_length(self):
+        """A ref removed and another appended behind the cell block's back
+        must not hide the new ref from later updates."""
+        cell_block = _cell_block(10, 11)
+        cell_block.updateRecords(_cell_block(11), _identity, set())
+        del cell_block.temp[0]
+        cell_block.temp.append(_Record(12))
+        cell_block.updateRecords(_cell_block(12), _identity, set())
+        assert [r.fid for r in cell_block.temp] == [11, 12]
+        assert cell_block.temp[1].is_copy
+
+    def test_reordered_refs(self):
+        """Reordering the refs directly must not make an update overwrite
+        the wrong ref."""
+        cell_block = _cell_block(10, 11)
+        cell_block.updateRecords(_cell_block(11), _identity, set())
+        cell_block.temp.reverse()
+        cell_block.updateRecords(_cell_block(10), _identity, set())
+        assert [r.fid for r in cell_block.temp] == [11, 10]
+        assert cell_block.temp[1].is_copy
+        assert not cell_block.temp[0].is_copy